@@ -5,41 +5,146 @@ This template provides a production-ready implementation of:
 - Database setup and configuration
 - Multiple model pattern (Base, Table, Create, Public, Update)
 - CRUD endpoints with proper error handling
-- Pagination and filtering
-- Dependency injection for session management
+- Cursor (keyset) pagination and filtering
+- Async database sessions via dependency injection
 - Input validation
 
 Usage:
 1. Customize the models to match your domain
 2. Update database URL in settings
-3. Run: uvicorn main:app --reload
+3. Install dependencies: pip install sqlmodel fastapi uvicorn orjson msgspec aiosqlite
+4. Run: uvicorn main:app --reload
+
+Schema management:
+Tables are created at startup for convenience. In production, manage the
+schema with Alembic migrations instead and set AUTO_CREATE_TABLES=0 so the
+app starts without issuing any DDL or schema introspection.
 """
 
+import os
+from contextlib import asynccontextmanager
 from typing import Annotated, List, Optional
-from fastapi import Depends, FastAPI, HTTPException, Query
-from sqlmodel import Field, Relationship, Session, SQLModel, create_engine, select
+import msgspec
+from fastapi import Depends, FastAPI, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy import Index, column, event, func, insert, text, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import joinedload, selectinload
+from sqlmodel import Field, Relationship, SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from pydantic import field_validator
 
 # ===== DATABASE CONFIGURATION =====
 
-DATABASE_URL = "sqlite:///./database.db"
+# Writes use INSERT/UPDATE ... RETURNING: needs SQLite 3.35+ or PostgreSQL
+DATABASE_URL = "sqlite+aiosqlite:///./database.db"
+
+# Set SQL_ECHO=1 to log every SQL statement while debugging; logging each
+# query is expensive, so it stays off by default
+SQL_ECHO = os.getenv("SQL_ECHO", "").lower() in ("1", "true", "yes")
+
+# Set AUTO_CREATE_TABLES=0 when the schema is managed by migrations
+AUTO_CREATE_TABLES = os.getenv("AUTO_CREATE_TABLES", "1").lower() in ("1", "true", "yes")
 
 connect_args = {"check_same_thread": False}  # SQLite only
-engine = create_engine(DATABASE_URL, echo=True, connect_args=connect_args)
+engine = create_async_engine(DATABASE_URL, echo=SQL_ECHO, connect_args=connect_args)
+
+
+if DATABASE_URL.startswith("sqlite"):
+    # Connection events are emitted by the sync engine the async one wraps
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn, _):
+        """Use WAL journaling so readers don't block on writers and commits skip a full fsync."""
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+        # SQLite ignores foreign keys unless asked; endpoints rely on the
+        # hero.team_id constraint instead of checking the team first
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+# Trigram full-text index over hero.name so `name` substring filters can use
+# MATCH instead of scanning every row with LIKE '%...%' (SQLite 3.34+)
+HERO_FTS_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS hero_fts USING fts5(
+        name, content='hero', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS hero_fts_ai AFTER INSERT ON hero BEGIN
+        INSERT INTO hero_fts(rowid, name) VALUES (new.id, new.name);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS hero_fts_ad AFTER DELETE ON hero BEGIN
+        INSERT INTO hero_fts(hero_fts, rowid, name) VALUES ('delete', old.id, old.name);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS hero_fts_au AFTER UPDATE OF name ON hero BEGIN
+        INSERT INTO hero_fts(hero_fts, rowid, name) VALUES ('delete', old.id, old.name);
+        INSERT INTO hero_fts(rowid, name) VALUES (new.id, new.name);
+    END
+    """,
+]
+
+# The trigram tokenizer can only match search terms of 3+ characters
+FTS_MIN_QUERY_LENGTH = 3
+
+# PostgreSQL equivalent: a trigram GIN index that ILIKE '%...%' can use
+HERO_TRGM_DDL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS ix_hero_name_trgm ON hero USING gin (name gin_trgm_ops)",
+]
+
 
+_tables_created = False
 
-def create_db_and_tables():
-    """Create database tables."""
-    SQLModel.metadata.create_all(engine)
 
+async def create_db_and_tables():
+    """
+    Create database tables and the backend-specific hero name search index.
 
-def get_session():
+    Runs at most once per process: create_all inspects every table, so
+    repeated calls (e.g. from a handler) would redo that work each time.
+    """
+    global _tables_created
+    if _tables_created:
+        return
+
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+
+        if engine.dialect.name == "sqlite":
+            fts_exists = (await conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE name = 'hero_fts'")
+            )).first()
+            for ddl in HERO_FTS_DDL:
+                await conn.execute(text(ddl))
+            if not fts_exists:
+                # Index heroes that were inserted before the triggers existed
+                await conn.execute(text("INSERT INTO hero_fts(hero_fts) VALUES ('rebuild')"))
+        elif engine.dialect.name == "postgresql":
+            for ddl in HERO_TRGM_DDL:
+                await conn.execute(text(ddl))
+
+    _tables_created = True
+
+
+async def get_session():
     """Dependency for database sessions."""
-    with Session(engine) as session:
+    # expire_on_commit=False: reading attributes after commit would otherwise
+    # trigger an implicit (and, under asyncio, illegal) lazy reload
+    async with AsyncSession(engine, expire_on_commit=False) as session:
         yield session
 
 
-SessionDep = Annotated[Session, Depends(get_session)]
+SessionDep = Annotated[AsyncSession, Depends(get_session)]
 
 # ===== MODELS: Team =====
 
@@ -67,6 +172,12 @@ class TeamPublic(TeamBase):
     id: int
 
 
+class TeamsPublic(SQLModel):
+    """Paginated list of teams."""
+    data: List[TeamPublic]
+    next_cursor: Optional[int] = None
+
+
 class TeamPublicWithHeroes(TeamPublic):
     """Team model including related heroes."""
     heroes: List["HeroPublic"] = []
@@ -97,6 +208,9 @@ class HeroBase(SQLModel):
 
 class Hero(HeroBase, table=True):
     """Hero table model."""
+    # Serves read_heroes when filtering on an age range and name together
+    __table_args__ = (Index("ix_hero_age_name", "age", "name"),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     team_id: Optional[int] = Field(default=None, foreign_key="team.id")
 
@@ -104,6 +218,10 @@ class Hero(HeroBase, table=True):
     team: Optional[Team] = Relationship(back_populates="heroes")
 
 
+# Case-insensitive prefix search (name_prefix) is a range scan on this index
+Index("ix_hero_name_lower", func.lower(Hero.name))
+
+
 class HeroCreate(HeroBase):
     """Model for creating heroes."""
     team_id: Optional[int] = None
@@ -114,6 +232,12 @@ class HeroPublic(HeroBase):
     id: int
 
 
+class HeroesPublic(SQLModel):
+    """Paginated list of heroes."""
+    data: List[HeroPublic]
+    next_cursor: Optional[int] = None
+
+
 class HeroPublicWithTeam(HeroPublic):
     """Hero model including related team."""
     team: Optional[TeamPublic] = None
@@ -127,177 +251,408 @@ class HeroUpdate(SQLModel):
     team_id: Optional[int] = None
 
 
+# Resolve the forward reference to HeroPublic now that it is defined
+TeamPublicWithHeroes.model_rebuild()
+
+
+# ===== SERIALIZATION STRUCTS =====
+# msgspec mirrors of the *Public models, used by the list endpoints where
+# serialization dominates. Keep the fields in sync with TeamPublic/HeroPublic.
+
+class TeamPublicMS(msgspec.Struct):
+    """msgspec mirror of TeamPublic."""
+    id: int
+    name: str
+    headquarters: str
+
+
+class HeroPublicMS(msgspec.Struct):
+    """msgspec mirror of HeroPublic."""
+    id: int
+    name: str
+    secret_name: str
+    age: Optional[int] = None
+
+
+def json_response(content, status_code: int = 200) -> Response:
+    """Encode `content` with msgspec and wrap it in a JSON response."""
+    return Response(
+        content=msgspec.json.encode(content),
+        media_type="application/json",
+        status_code=status_code,
+    )
+
+
+# Rows fetched from the database per round trip when streaming list pages
+STREAM_BATCH_SIZE = 500
+
+
+async def stream_heroes_page(statement, limit: int):
+    """
+    Yield a HeroesPublic JSON document in chunks as rows arrive.
+
+    Opens its own session: FastAPI closes dependency sessions before a
+    streaming body is sent.
+    """
+    async with AsyncSession(engine) as session:
+        result = await session.stream(
+            statement.execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+        yield b'{"data":['
+        count = 0
+        last_id = None
+        async for rows in result.partitions():
+            chunk = b",".join(msgspec.json.encode(HeroPublicMS(*row)) for row in rows)
+            yield (b"," + chunk) if count else chunk
+            count += len(rows)
+            last_id = rows[-1].id
+        next_cursor = last_id if count == limit else None
+        yield b'],"next_cursor":' + msgspec.json.encode(next_cursor) + b"}"
+
+
+@asynccontextmanager
+async def team_must_exist(session: AsyncSession):
+    """
+    Turn a hero.team_id foreign key violation into a 404.
+
+    Writing first and letting the constraint reject an unknown team saves
+    the SELECT that checking for the team up front would cost.
+    """
+    try:
+        yield
+    except IntegrityError:
+        await session.rollback()
+        raise HTTPException(status_code=404, detail="Team not found")
+
+
+def to_public(model, obj):
+    """
+    Build a response model from a trusted table row without re-validating.
+
+    Rows read from the database already satisfied the table model's
+    validation, so model_construct just copies the fields across. Only use
+    this for data that came out of the database, never for request input.
+    """
+    return model.model_construct(
+        **{name: getattr(obj, name) for name in model.model_fields}
+    )
+
+
 # ===== FASTAPI APP =====
 
 app = FastAPI(
     title="SQLModel CRUD API",
     description="Complete CRUD API with SQLModel and FastAPI",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
 )
 
 
 @app.on_event("startup")
-def on_startup():
+async def on_startup():
     """Initialize database on application startup."""
-    create_db_and_tables()
+    if AUTO_CREATE_TABLES:
+        await create_db_and_tables()
 
 
 # ===== HERO ENDPOINTS =====
 
-@app.post("/heroes/", response_model=HeroPublic, status_code=201, tags=["heroes"])
-def create_hero(*, session: SessionDep, hero: HeroCreate):
+@app.post(
+    "/heroes/",
+    response_model=None,
+    status_code=201,
+    responses={201: {"model": HeroPublic}},
+    tags=["heroes"],
+)
+async def create_hero(*, session: SessionDep, hero: HeroCreate):
     """Create a new hero."""
-    # Validate team exists if provided
-    if hero.team_id:
-        team = session.get(Team, hero.team_id)
-        if not team:
-            raise HTTPException(status_code=404, detail="Team not found")
-
-    db_hero = Hero.model_validate(hero)
-    session.add(db_hero)
-    session.commit()
-    session.refresh(db_hero)
-    return db_hero
-
+    # INSERT ... RETURNING gives back the generated row in the same round
+    # trip, so no refresh is needed after commit
+    async with team_must_exist(session):
+        result = await session.execute(
+            insert(Hero).values(**hero.model_dump()).returning(Hero)
+        )
+        db_hero = result.scalar_one()
+        await session.commit()
+    return to_public(HeroPublic, db_hero)
+
+
+@app.post(
+    "/heroes/bulk",
+    response_model=None,
+    status_code=201,
+    responses={201: {"model": List[HeroPublic]}},
+    tags=["heroes"],
+)
+async def create_heroes_bulk(*, session: SessionDep, heroes: List[HeroCreate]):
+    """
+    Create many heroes in a single INSERT statement.
 
-@app.get("/heroes/", response_model=List[HeroPublic], tags=["heroes"])
-def read_heroes(
+    Skips per-object unit-of-work bookkeeping, so prefer this over repeated
+    POST /heroes/ calls when loading data in batches.
+    """
+    if not heroes:
+        return json_response([], status_code=201)
+
+    async with team_must_exist(session):
+        result = await session.execute(
+            insert(Hero).returning(
+                Hero.id, Hero.name, Hero.secret_name, Hero.age
+            ),
+            [hero.model_dump() for hero in heroes],
+        )
+        rows = result.all()
+        await session.commit()
+    return json_response([HeroPublicMS(*row) for row in rows], status_code=201)
+
+
+@app.get(
+    "/heroes/",
+    response_model=None,
+    responses={200: {"model": HeroesPublic}},
+    tags=["heroes"],
+)
+async def read_heroes(
     *,
-    session: SessionDep,
-    offset: int = 0,
-    limit: int = Query(default=100, le=100),
+    after_id: Optional[int] = None,
+    offset: Optional[int] = Query(default=None, ge=0, deprecated=True),
+    limit: int = Query(default=100, ge=1, le=1000),
     name: Optional[str] = None,
+    name_prefix: Optional[str] = None,
     min_age: Optional[int] = None,
     max_age: Optional[int] = None,
 ):
     """
     Get list of heroes with optional filtering and pagination.
 
-    - **offset**: Number of records to skip
-    - **limit**: Maximum number of records to return (max 100)
+    - **after_id**: Cursor; return heroes with an ID greater than this
+      (pass the previous page's `next_cursor`)
+    - **offset**: Deprecated. Number of records to skip; the database still
+      scans every skipped row, so deep pages get slower. Prefer `after_id`
+    - **limit**: Maximum number of records to return (max 1000)
     - **name**: Filter by name (partial match)
+    - **name_prefix**: Filter by name prefix, case-insensitive (index lookup,
+      cheaper than `name` when you only need "starts with")
     - **min_age**: Minimum age filter
     - **max_age**: Maximum age filter
+
+    The page is streamed as rows are fetched, so large pages start
+    arriving immediately and are never held in memory all at once.
     """
-    statement = select(Hero)
+    statement = select(Hero.id, Hero.name, Hero.secret_name, Hero.age)
 
     # Apply filters
     if name:
-        statement = statement.where(Hero.name.ilike(f"%{name}%"))
+        if engine.dialect.name == "sqlite" and len(name) >= FTS_MIN_QUERY_LENGTH:
+            # Quote the term so FTS5 treats it as a literal substring
+            fts_query = '"' + name.replace('"', '""') + '"'
+            matching_ids = (
+                text("SELECT rowid FROM hero_fts WHERE hero_fts MATCH :query")
+                .bindparams(query=fts_query)
+                .columns(column("rowid"))
+            )
+            statement = statement.where(Hero.id.in_(matching_ids))
+        else:
+            statement = statement.where(Hero.name.ilike(f"%{name}%"))
+    if name_prefix:
+        # lower(name) >= 'abc' AND lower(name) < 'abd' can use the expression
+        # index; LIKE 'abc%' generally can't
+        prefix = name_prefix.lower()
+        upper_bound = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        statement = statement.where(
+            func.lower(Hero.name) >= prefix,
+            func.lower(Hero.name) < upper_bound,
+        )
     if min_age is not None:
         statement = statement.where(Hero.age >= min_age)
     if max_age is not None:
         statement = statement.where(Hero.age <= max_age)
 
-    # Apply pagination
-    statement = statement.offset(offset).limit(limit)
+    # Apply pagination (keyset on the primary key unless offset is requested)
+    statement = statement.order_by(Hero.id).limit(limit)
+    if offset is not None:
+        statement = statement.offset(offset)
+    elif after_id is not None:
+        statement = statement.where(Hero.id > after_id)
 
-    heroes = session.exec(statement).all()
-    return heroes
+    return StreamingResponse(
+        stream_heroes_page(statement, limit),
+        media_type="application/json",
+    )
 
 
-@app.get("/heroes/{hero_id}", response_model=HeroPublicWithTeam, tags=["heroes"])
-def read_hero(*, session: SessionDep, hero_id: int):
+@app.get(
+    "/heroes/{hero_id}",
+    response_model=None,
+    responses={200: {"model": HeroPublicWithTeam}},
+    tags=["heroes"],
+)
+async def read_hero(*, session: SessionDep, hero_id: int):
     """Get a specific hero by ID."""
-    hero = session.get(Hero, hero_id)
+    # Load the team in the same query; serializing HeroPublicWithTeam would
+    # otherwise trigger a second, lazy SELECT for hero.team
+    hero = await session.get(Hero, hero_id, options=[joinedload(Hero.team)])
     if not hero:
         raise HTTPException(status_code=404, detail="Hero not found")
-    return hero
+
+    public = to_public(HeroPublicWithTeam, hero)
+    if hero.team is not None:
+        public.team = to_public(TeamPublic, hero.team)
+    return public
 
 
-@app.patch("/heroes/{hero_id}", response_model=HeroPublic, tags=["heroes"])
-def update_hero(*, session: SessionDep, hero_id: int, hero: HeroUpdate):
+@app.patch(
+    "/heroes/{hero_id}",
+    response_model=None,
+    responses={200: {"model": HeroPublic}},
+    tags=["heroes"],
+)
+async def update_hero(*, session: SessionDep, hero_id: int, hero: HeroUpdate):
     """Update a hero (partial update allowed)."""
-    db_hero = session.get(Hero, hero_id)
+    # Update only provided fields; UPDATE ... RETURNING writes and reads the
+    # row back in one statement instead of get + flush + refresh
+    hero_data = hero.model_dump(exclude_unset=True)
+    if hero_data:
+        async with team_must_exist(session):
+            result = await session.execute(
+                update(Hero).where(Hero.id == hero_id).values(**hero_data).returning(Hero)
+            )
+            db_hero = result.scalar_one_or_none()
+    else:
+        db_hero = await session.get(Hero, hero_id)
     if not db_hero:
         raise HTTPException(status_code=404, detail="Hero not found")
 
-    # Validate team exists if being updated
-    if hero.team_id is not None:
-        team = session.get(Team, hero.team_id)
-        if not team:
-            raise HTTPException(status_code=404, detail="Team not found")
-
-    # Update only provided fields
-    hero_data = hero.model_dump(exclude_unset=True)
-    db_hero.sqlmodel_update(hero_data)
-
-    session.add(db_hero)
-    session.commit()
-    session.refresh(db_hero)
-    return db_hero
+    await session.commit()
+    return to_public(HeroPublic, db_hero)
 
 
 @app.delete("/heroes/{hero_id}", tags=["heroes"])
-def delete_hero(*, session: SessionDep, hero_id: int):
+async def delete_hero(*, session: SessionDep, hero_id: int):
     """Delete a hero."""
-    hero = session.get(Hero, hero_id)
+    hero = await session.get(Hero, hero_id)
     if not hero:
         raise HTTPException(status_code=404, detail="Hero not found")
 
-    session.delete(hero)
-    session.commit()
+    await session.delete(hero)
+    await session.commit()
     return {"ok": True, "message": f"Hero {hero.name} deleted"}
 
 
 # ===== TEAM ENDPOINTS =====
 
-@app.post("/teams/", response_model=TeamPublic, status_code=201, tags=["teams"])
-def create_team(*, session: SessionDep, team: TeamCreate):
+@app.post(
+    "/teams/",
+    response_model=None,
+    status_code=201,
+    responses={201: {"model": TeamPublic}},
+    tags=["teams"],
+)
+async def create_team(*, session: SessionDep, team: TeamCreate):
     """Create a new team."""
-    db_team = Team.model_validate(team)
-    session.add(db_team)
-    session.commit()
-    session.refresh(db_team)
-    return db_team
-
-
-@app.get("/teams/", response_model=List[TeamPublic], tags=["teams"])
-def read_teams(
+    result = await session.execute(
+        insert(Team).values(**team.model_dump()).returning(Team)
+    )
+    db_team = result.scalar_one()
+    await session.commit()
+    return to_public(TeamPublic, db_team)
+
+
+@app.get(
+    "/teams/",
+    response_model=None,
+    responses={200: {"model": TeamsPublic}},
+    tags=["teams"],
+)
+async def read_teams(
     *,
     session: SessionDep,
-    offset: int = 0,
+    after_id: Optional[int] = None,
+    offset: Optional[int] = Query(default=None, ge=0, deprecated=True),
     limit: int = Query(default=100, le=100)
 ):
-    """Get list of teams with pagination."""
-    teams = session.exec(select(Team).offset(offset).limit(limit)).all()
-    return teams
-
+    """
+    Get list of teams with cursor pagination.
 
-@app.get("/teams/{team_id}", response_model=TeamPublicWithHeroes, tags=["teams"])
-def read_team(*, session: SessionDep, team_id: int):
+    - **after_id**: Cursor; pass the previous page's `next_cursor`
+    - **offset**: Deprecated, slow for deep pages. Prefer `after_id`
+    - **limit**: Maximum number of records to return (max 100)
+    """
+    statement = select(Team).order_by(Team.id).limit(limit)
+    if offset is not None:
+        statement = statement.offset(offset)
+    elif after_id is not None:
+        statement = statement.where(Team.id > after_id)
+
+    teams = (await session.exec(statement)).all()
+    next_cursor = teams[-1].id if len(teams) == limit else None
+    return json_response({
+        "data": [
+            TeamPublicMS(id=team.id, name=team.name, headquarters=team.headquarters)
+            for team in teams
+        ],
+        "next_cursor": next_cursor,
+    })
+
+
+@app.get(
+    "/teams/{team_id}",
+    response_model=None,
+    responses={200: {"model": TeamPublicWithHeroes}},
+    tags=["teams"],
+)
+async def read_team(*, session: SessionDep, team_id: int):
     """Get a specific team by ID with its heroes."""
-    team = session.get(Team, team_id)
+    # Eager-load heroes with a single SELECT ... IN instead of a lazy load
+    # fired during TeamPublicWithHeroes serialization (N+1 pattern)
+    statement = (
+        select(Team)
+        .where(Team.id == team_id)
+        .options(selectinload(Team.heroes))
+    )
+    team = (await session.exec(statement)).first()
     if not team:
         raise HTTPException(status_code=404, detail="Team not found")
-    return team
+
+    public = to_public(TeamPublicWithHeroes, team)
+    public.heroes = [to_public(HeroPublic, hero) for hero in team.heroes]
+    return public
 
 
-@app.patch("/teams/{team_id}", response_model=TeamPublic, tags=["teams"])
-def update_team(*, session: SessionDep, team_id: int, team: TeamUpdate):
+@app.patch(
+    "/teams/{team_id}",
+    response_model=None,
+    responses={200: {"model": TeamPublic}},
+    tags=["teams"],
+)
+async def update_team(*, session: SessionDep, team_id: int, team: TeamUpdate):
     """Update a team (partial update allowed)."""
-    db_team = session.get(Team, team_id)
+    team_data = team.model_dump(exclude_unset=True)
+    if team_data:
+        result = await session.execute(
+            update(Team).where(Team.id == team_id).values(**team_data).returning(Team)
+        )
+        db_team = result.scalar_one_or_none()
+    else:
+        db_team = await session.get(Team, team_id)
     if not db_team:
         raise HTTPException(status_code=404, detail="Team not found")
 
-    team_data = team.model_dump(exclude_unset=True)
-    db_team.sqlmodel_update(team_data)
-
-    session.add(db_team)
-    session.commit()
-    session.refresh(db_team)
-    return db_team
+    await session.commit()
+    return to_public(TeamPublic, db_team)
 
 
 @app.delete("/teams/{team_id}", tags=["teams"])
-def delete_team(*, session: SessionDep, team_id: int):
+async def delete_team(*, session: SessionDep, team_id: int):
     """Delete a team."""
-    team = session.get(Team, team_id)
+    # Heroes are loaded up front so unlinking them on delete doesn't need a
+    # lazy load, which AsyncSession can't do implicitly
+    team = await session.get(Team, team_id, options=[selectinload(Team.heroes)])
     if not team:
         raise HTTPException(status_code=404, detail="Team not found")
 
-    session.delete(team)
-    session.commit()
+    await session.delete(team)
+    await session.commit()
     return {"ok": True, "message": f"Team {team.name} deleted"}
 
 
@@ -56,7 +56,7 @@ class UserBase(SQLModel):
         unique=True,
         min_length=3,
         max_length=50,
-        pattern=r"^[a-zA-Z0-9_]+$"
+        schema_extra={"pattern": r"^[a-zA-Z0-9_]+$"},
     )
     email: EmailStr = Field(index=True, unique=True)
     full_name: str = Field(min_length=1, max_length=100)
@@ -65,10 +65,12 @@ class UserBase(SQLModel):
 
     @field_validator('username')
     @classmethod
-    def username_alphanumeric(cls, v: str) -> str:
-        """Ensure username is alphanumeric."""
-        if not v.replace('_', '').isalnum():
-            raise ValueError('Username must be alphanumeric')
+    def username_lowercase(cls, v: str) -> str:
+        """Normalize username to lowercase.
+
+        The alphanumeric check is done by the `pattern` constraint above,
+        which pydantic-core evaluates natively before this validator runs.
+        """
         return v.lower()
 
 
@@ -301,10 +303,12 @@ if __name__ == "__main__":
     create_all_tables(engine)
 
     with Session(engine) as session:
-        # Create user
+        # Everything below is one transaction: rows are flushed when their
+        # generated IDs are needed, and committed once at the end
         from passlib.context import CryptContext
         pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+        # Create user and category
         user = User(
             username="johndoe",
             email="john@example.com",
@@ -312,18 +316,12 @@ if __name__ == "__main__":
             password_hash=pwd_context.hash("SecurePass123"),
             role=UserRole.USER
         )
-        session.add(user)
-        session.commit()
-        session.refresh(user)
-
-        # Create category
         category = Category(
             name="Electronics",
             description="Electronic products"
         )
-        session.add(category)
-        session.commit()
-        session.refresh(category)
+        session.add_all([user, category])
+        session.flush()  # assigns user.id and category.id
 
         # Create product
         product = Product(
@@ -337,22 +335,27 @@ if __name__ == "__main__":
             owner_id=user.id
         )
         session.add(product)
-        session.commit()
-        session.refresh(product)
+        session.flush()  # assigns product.id
 
-        # Create order with items
-        order = Order(user_id=user.id, status="pending")
-        session.add(order)
-        session.commit()
-        session.refresh(order)
+        # Create order with items from an OrderCreate payload
+        payload = OrderCreate(items=[{"product_id": product.id, "quantity": 2}])
+        prices = {product.id: product.price}
 
-        order_item = OrderItem(
-            order_id=order.id,
-            product_id=product.id,
-            quantity=2,
-            unit_price=product.price
-        )
-        session.add(order_item)
+        order = Order(user_id=user.id, status=payload.status, notes=payload.notes)
+        session.add(order)
+        session.flush()  # assigns order.id
+
+        # Build every item first and add them together; never commit per item
+        items = [
+            OrderItem(
+                order_id=order.id,
+                product_id=item["product_id"],
+                quantity=item["quantity"],
+                unit_price=prices[item["product_id"]]
+            )
+            for item in payload.items
+        ]
+        session.add_all(items)
         session.commit()
 
         print(f"Created order {order.id} for user {user.username}")
@@ -5,18 +5,18 @@ Provides AI-powered agents using OpenAI Agent SDK with Gemini integration
 for natural language processing, task intelligence, and context management.
 """
 
-from app.agents.task_parser import TaskParserAgent, task_parser_agent
+from app.agents.task_parser import TaskParserAgent, get_task_parser_agent
 from app.agents.task_intelligence_agent import (
     TaskIntelligenceAgent,
-    task_intelligence_agent
+    get_task_intelligence_agent
 )
 from app.agents.context_manager import ContextManager, get_context_manager
 
 __all__ = [
     "TaskParserAgent",
-    "task_parser_agent",
+    "get_task_parser_agent",
     "TaskIntelligenceAgent",
-    "task_intelligence_agent",
+    "get_task_intelligence_agent",
     "ContextManager",
     "get_context_manager",
 ]
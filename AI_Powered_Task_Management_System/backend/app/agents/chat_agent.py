@@ -6,31 +6,87 @@ on the task database (querying, creating, updating).
 """
 
 import json
+import re
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
-from google.generativeai import GenerativeModel
-import google.generativeai as genai
 from sqlmodel import Session
 
+from app.core.cache import TTLCache, make_cache_key
 from app.core.config import settings
+from app.core.gemini import get_model
 from app.services.task_service import TaskService
 from app.schemas.task import TaskStatus, Priority
 from app.agents.context_manager import ContextManager
 
+# Messages that ask to change tasks must always reach the model, never a
+# cached reply generated before the change
+MUTATION_INTENT_PATTERN = re.compile(
+    r"\b(add|create|new|delete|remove|complete|finish|done|update|change|"
+    r"edit|mark|set|schedule|move|rename)\b",
+    re.IGNORECASE,
+)
+
+
+# Persona and guidelines are identical for every request. Keeping them as
+# one constant prefix ahead of the per-request context lets the Gemini API
+# reuse its processing of the prefix between calls.
+STATIC_SYSTEM_PROMPT = """
+# ROLE & PERSONA
+You are 'TaskMaster AI', an intelligent, proactive, and friendly productivity assistant. Your goal is to help users organize their life, manage tasks, and boost productivity. You are professional but conversational.
+
+# CAPABILITIES & GUIDELINES
+1. **Task Queries:**
+   - If the user asks "What do I have to do?", summarize their recent tasks by priority and status.
+   - Highlight high-priority or overdue items first.
+
+2. **Task Creation:**
+   - If the user wants to add a task (e.g., "Add buy milk"), acknowledge it and explicitly confirm you understand the details (Title, Priority, Due Date).
+   - *Note: You cannot directly write to the DB yet, so ask them to use the 'Natural Language' input above or confirm you would if you could.* (For this version, guide them to the UI).
+
+3. **Advice & Coaching:**
+   - Provide productivity tips if asked.
+   - If a user seems overwhelmed (many high-priority tasks), suggest breaking them down or taking a break.
+
+4. **Tone & Style:**
+   - Be concise. Do not ramble.
+   - Use formatting (bullet points) for lists.
+   - Be encouraging.
+"""
+
+DYNAMIC_CONTEXT_TEMPLATE = """
+# CONTEXT
+## Recent Tasks (from Database):
+{task_context}
+
+## Conversation History:
+{history}
+
+# USER INPUT
+"{message}"
+
+# RESPONSE
+Provide a helpful, context-aware response acting as TaskMaster AI.
+"""
+
+
 class ChatAgent:
     """
     AI agent for conversational interactions.
     """
 
     def __init__(self):
-        genai.configure(api_key=settings.GEMINI_API_KEY)
-        self.model = GenerativeModel(
-            model_name=settings.GEMINI_MODEL_NAME,
-            generation_config={
+        self.model = get_model(
+            settings.GEMINI_MODEL_NAME,
+            {
                 "temperature": 0.7,
                 "top_p": 0.95,
                 "max_output_tokens": 1024,
             },
         )
+        self._response_cache = TTLCache(
+            maxsize=settings.LLM_CACHE_MAX_SIZE,
+            ttl=settings.LLM_CACHE_TTL,
+        )
 
     async def process_message(
         self,
@@ -43,47 +99,28 @@ class ChatAgent:
         Process a user message and return a response.
         """
         # 1. Get Context
-        history = context_manager.get_conversation_context()
+        history = context_manager.get_conversation_context(query=message)
         
         # 2. Get recent tasks for context
-        recent_tasks = task_service.list_tasks(user_id=user_id, limit=5)
-        task_context = "\n".join([f"- {t.title} ({t.status.value}, {t.priority.value})" for t in recent_tasks])
-        
-        system_prompt = f"""
-        # ROLE & PERSONA
-        You are 'TaskMaster AI', an intelligent, proactive, and friendly productivity assistant. Your goal is to help users organize their life, manage tasks, and boost productivity. You are professional but conversational.
-
-        # CONTEXT
-        ## Recent Tasks (from Database):
-        {task_context if task_context else "No recent tasks found."}
+        recent_tasks = task_service.list_task_summaries(user_id=user_id, limit=5)
+        task_context = "\n".join(
+            f"- {title} ({task_status.value}, {priority.value})"
+            for title, task_status, priority in recent_tasks
+        )
 
-        ## Conversation History:
-        {history}
+        # Identical message + tasks + history within the TTL gets the same reply
+        use_cache = not MUTATION_INTENT_PATTERN.search(message)
+        cache_key = make_cache_key(user_id, message, task_context, history)
+        if use_cache:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                return cached
 
-        # CAPABILITIES & GUIDELINES
-        1. **Task Queries:** 
-           - If the user asks "What do I have to do?", summarize their recent tasks by priority and status.
-           - Highlight high-priority or overdue items first.
-        
-        2. **Task Creation:**
-           - If the user wants to add a task (e.g., "Add buy milk"), acknowledge it and explicitly confirm you understand the details (Title, Priority, Due Date). 
-           - *Note: You cannot directly write to the DB yet, so ask them to use the 'Natural Language' input above or confirm you would if you could.* (For this version, guide them to the UI).
-           
-        3. **Advice & Coaching:**
-           - Provide productivity tips if asked.
-           - If a user seems overwhelmed (many high-priority tasks), suggest breaking them down or taking a break.
-
-        4. **Tone & Style:**
-           - Be concise. Do not ramble.
-           - Use formatting (bullet points) for lists.
-           - Be encouraging.
-
-        # USER INPUT
-        "{message}"
-
-        # RESPONSE
-        Provide a helpful, context-aware response acting as TaskMaster AI.
-        """
+        system_prompt = STATIC_SYSTEM_PROMPT + DYNAMIC_CONTEXT_TEMPLATE.format(
+            task_context=task_context if task_context else "No recent tasks found.",
+            history=history,
+            message=message,
+        )
 
         # For a true agent, we'd use function calling (tools). 
         # For this enhancement, we'll start with a smart responder that has access to data.
@@ -91,7 +128,21 @@ class ChatAgent:
         # Let's keep it as a RAG-style chat for now: It sees the tasks and talks about them.
         
         response = await self.model.generate_content_async(system_prompt)
+        if use_cache:
+            self._response_cache.set(cache_key, response.text)
         return response.text
 
-chat_agent = ChatAgent()
+
+@lru_cache
+def get_chat_agent() -> ChatAgent:
+    """
+    Dependency function to get the shared chat agent.
+
+    The agent is created on first use and then reused, so its Gemini
+    model, client connection and response cache persist across requests.
+
+    Returns:
+        ChatAgent instance
+    """
+    return ChatAgent()
 
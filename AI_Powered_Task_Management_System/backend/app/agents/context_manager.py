@@ -5,12 +5,78 @@ Maintains short-term and long-term memory for AI agents,
 enabling context-aware task assistance and personalized recommendations.
 """
 
-from typing import Dict, List, Optional, Any
-from datetime import datetime
-from collections import deque
+import math
+import re
+from typing import Dict, List, NamedTuple, Optional, Any
+from datetime import datetime, timezone
+from collections import Counter, deque
 
 from app.models.conversation import ConversationMessage
-from sqlmodel import Session, select
+from sqlalchemy import bindparam
+from sqlmodel import Session, select, func
+
+
+# Messages are kept in short-term memory as previews of this many characters;
+# the full text stays in the database
+MESSAGE_PREVIEW_LENGTH = 200
+
+# The most recent messages are always part of the conversation context so
+# follow-up questions keep their antecedent, however little they overlap
+RECENT_MESSAGES_ALWAYS_INCLUDED = 2
+
+# Latest 10 messages of a user, oldest first. Built once at import time and
+# run with a bound user_id; content is truncated in SQL so only the preview
+# of long messages is transferred.
+_latest_messages = (
+    select(
+        ConversationMessage.role,
+        func.substr(ConversationMessage.content, 1, MESSAGE_PREVIEW_LENGTH).label("content"),
+        ConversationMessage.created_at,
+        ConversationMessage.message_metadata,
+    )
+    .where(ConversationMessage.user_id == bindparam("user_id"))
+    .order_by(ConversationMessage.created_at.desc())
+    .limit(10)
+    .subquery()
+)
+_RECENT_HISTORY_STATEMENT = select(
+    _latest_messages.c.role,
+    _latest_messages.c.content,
+    _latest_messages.c.created_at,
+    _latest_messages.c.message_metadata,
+).order_by(_latest_messages.c.created_at.asc())
+
+_UTC = timezone.utc
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+
+class Msg(NamedTuple):
+    """A message held in short-term memory."""
+
+    role: str
+    content: str
+    timestamp: datetime
+    metadata: Dict[str, Any]
+
+
+def _term_vector(text: str) -> Counter:
+    """Bag-of-words term counts of text, lowercased."""
+    return Counter(_WORD_PATTERN.findall(text.lower()))
+
+
+def _cosine_similarity(a: Counter, b: Counter) -> float:
+    """Cosine similarity of two term-count vectors."""
+    if not a or not b:
+        return 0.0
+    if len(a) > len(b):
+        a, b = b, a
+    dot = sum(count * b[term] for term, count in a.items())
+    if not dot:
+        return 0.0
+    norm_a = math.sqrt(sum(count * count for count in a.values()))
+    norm_b = math.sqrt(sum(count * count for count in b.values()))
+    return dot / (norm_a * norm_b)
 
 
 class ContextManager:
@@ -32,32 +98,23 @@ class ContextManager:
         self.session = session
         self.user_id = user_id
 
-        # Short-term memory (current session)
-        self.conversation_buffer: deque = deque(maxlen=10)  # Last 10 messages
+        # Short-term memory (current session); message content is truncated
+        # to MESSAGE_PREVIEW_LENGTH characters
+        self.conversation_buffer: "deque[Msg]" = deque(maxlen=10)  # Last 10 messages
         self.working_memory: Dict[str, Any] = {}
 
+        self._term_vectors: Dict[str, Counter] = {}
+
         # Load recent conversation history
         self._load_recent_history()
 
     def _load_recent_history(self) -> None:
         """Load recent conversation history from database."""
-        statement = (
-            select(ConversationMessage)
-            .where(ConversationMessage.user_id == self.user_id)
-            .order_by(ConversationMessage.created_at.desc())
-            .limit(10)
+        rows = self.session.exec(
+            _RECENT_HISTORY_STATEMENT, params={"user_id": self.user_id}
         )
-
-        messages = self.session.exec(statement).all()
-
-        # Add to buffer in chronological order
-        for message in reversed(messages):
-            self.conversation_buffer.append({
-                "role": message.role,
-                "content": message.content,
-                "timestamp": message.created_at,
-                "metadata": message.message_metadata
-            })
+        for role, content, created_at, metadata in rows:
+            self.conversation_buffer.append(Msg(role, content, created_at, metadata))
 
     def add_message(
         self,
@@ -75,15 +132,14 @@ class ContextManager:
             metadata: Optional metadata
             persist: Whether to save to database
         """
-        message_data = {
-            "role": role,
-            "content": content,
-            "timestamp": datetime.utcnow(),
-            "metadata": metadata or {}
-        }
-
         # Add to short-term memory
-        self.conversation_buffer.append(message_data)
+        self.conversation_buffer.append(Msg(
+            role,
+            content[:MESSAGE_PREVIEW_LENGTH],
+            # Naive UTC, matching created_at of messages loaded from the database
+            datetime.now(_UTC).replace(tzinfo=None),
+            metadata or {},
+        ))
 
         # Persist to database if requested
         if persist:
@@ -114,27 +170,77 @@ class ContextManager:
         if limit:
             messages = messages[-limit:]
 
-        return messages
+        return [msg._asdict() for msg in messages]
 
-    def get_conversation_context(self) -> str:
+    def get_conversation_context(
+        self,
+        query: Optional[str] = None,
+        k: int = 5
+    ) -> str:
         """
         Get formatted conversation context for AI prompt.
 
+        Without a query every buffered message is included. With a query,
+        the most recent messages plus the earlier messages most similar to
+        the query (word-overlap cosine similarity) are included, up to k in
+        total, in their original order. Identical inputs always produce the
+        same text.
+
+        Args:
+            query: Current user message to rank past messages against
+            k: Maximum number of messages to include when query is given
+
         Returns:
             Formatted conversation history as string
         """
         if not self.conversation_buffer:
             return "No previous conversation."
 
+        messages = list(self.conversation_buffer)
+        if query is not None and len(messages) > k:
+            messages = self._select_relevant_messages(messages, query, k)
+
         context_lines = ["Recent Conversation:"]
 
-        for msg in self.conversation_buffer:
-            role = msg["role"].capitalize()
-            content = msg["content"][:200]  # Limit length
-            context_lines.append(f"{role}: {content}")
+        for msg in messages:
+            context_lines.append(f"{msg.role.capitalize()}: {msg.content}")
 
         return "\n".join(context_lines)
 
+    def _select_relevant_messages(
+        self,
+        messages: List[Msg],
+        query: str,
+        k: int
+    ) -> List[Msg]:
+        """
+        Pick the k messages to keep in chronological order.
+
+        Term vectors are cached by message content, so each buffered
+        message is tokenized once.
+        """
+        recent_count = min(RECENT_MESSAGES_ALWAYS_INCLUDED, k)
+        older = messages[:len(messages) - recent_count]
+        recent = messages[len(messages) - recent_count:]
+
+        query_terms = _term_vector(query)
+        term_vectors = {}
+        scored = []
+        for position, msg in enumerate(older):
+            terms = self._term_vectors.get(msg.content)
+            if terms is None:
+                terms = _term_vector(msg.content)
+            term_vectors[msg.content] = terms
+            # Later messages win ties
+            scored.append((_cosine_similarity(query_terms, terms), position))
+        # Keep only vectors of messages still in the buffer
+        self._term_vectors = term_vectors
+
+        top_positions = sorted(
+            position for _, position in sorted(scored, reverse=True)[:k - recent_count]
+        )
+        return [older[position] for position in top_positions] + recent
+
     def update_working_memory(
         self,
         key: str,
@@ -205,16 +311,22 @@ class ContextManager:
         if not self.conversation_buffer:
             return "No conversation to summarize."
 
-        # Simple summarization - count user vs assistant messages
-        user_count = sum(1 for msg in self.conversation_buffer if msg["role"] == "user")
+        # Simple summarization - count user vs assistant messages and keep
+        # the first and last user message, in one pass
+        user_count = 0
+        first_user = None
+        last_user = None
+        for msg in self.conversation_buffer:
+            if msg.role == "user":
+                user_count += 1
+                if first_user is None:
+                    first_user = msg
+                last_user = msg
         assistant_count = len(self.conversation_buffer) - user_count
 
-        # Get first and last user message
-        user_messages = [msg for msg in self.conversation_buffer if msg["role"] == "user"]
-
-        if user_messages:
-            first_topic = user_messages[0]["content"][:100]
-            last_topic = user_messages[-1]["content"][:100] if len(user_messages) > 1 else first_topic
+        if first_user is not None:
+            first_topic = first_user.content[:100]
+            last_topic = last_user.content[:100]
 
             return (
                 f"Conversation with {user_count} user messages and {assistant_count} responses. "
@@ -245,16 +357,17 @@ class ContextManager:
             }
 
         # Analyze recent tasks
-        priorities = [task.priority.value for task in recent_tasks]
-        common_priority = max(set(priorities), key=priorities.count) if priorities else "medium"
+        priority_counts = Counter(task.priority.value for task in recent_tasks)
+        common_priority = priority_counts.most_common(1)[0][0]
 
         # Extract categories from metadata or tags
-        categories = []
-        for task in recent_tasks:
-            if hasattr(task, 'tags') and task.tags:
-                categories.extend([tag.name for tag in task.tags])
-
-        common_categories = list(set(categories))[:5]  # Top 5 categories
+        category_counts = Counter(
+            tag.name
+            for task in recent_tasks
+            if getattr(task, "tags", None)
+            for tag in task.tags
+        )
+        common_categories = [name for name, _ in category_counts.most_common(5)]  # Top 5 categories
 
         return {
             "recent_task_count": len(recent_tasks),
@@ -5,41 +5,105 @@ Database Agent using ReAct pattern to interact with the database.
 import json
 import re
 from typing import List, Dict, Any, Optional
-from google.generativeai import GenerativeModel
-import google.generativeai as genai
+
+import orjson
 from google.api_core.exceptions import ResourceExhausted, GoogleAPIError
 from app.core.config import settings
+from app.core.gemini import get_cached_content, get_model
 from app.agents.tools import AgentTools
 
+TOOL_DEFINITIONS = """
+Available Tools:
+- list_tasks(status: str = None, limit: int = 10): List tasks. status can be 'todo', 'in_progress', 'completed'.
+- create_task(title: str, description: str = None, priority: str = 'medium', due_date: str = None): Create a task.
+- delete_task(task_id: int): Delete a task by ID.
+- complete_task(task_id: int): Mark a task as completed.
+- search_tasks(query: str): Search tasks by text.
+"""
+
+# Rules, tools and output format never change between requests, so they are
+# sent as the first turn of every conversation. Keeping this prefix
+# byte-identical lets the provider reuse its cached processing of it; only
+# the history and the user request that follow vary.
+SYSTEM_PROMPT = f"""
+You are a helpful task management assistant. You can access the user's database directly.
+
+{TOOL_DEFINITIONS}
+
+To use a tool, output a JSON block like this:
+```json
+{{
+    "tool": "create_task",
+    "args": {{
+        "title": "Buy milk",
+        "priority": "high"
+    }}
+}}
+```
+
+When you have completed the request or need to reply to the user, use the 'final_answer' tool:
+```json
+{{
+    "tool": "final_answer",
+    "args": {{
+        "message": "I have created the task for you."
+    }}
+}}
+```
+"""
+
+# Model turn closing the static prefix so the conversation keeps
+# alternating between user and model roles
+SYSTEM_PROMPT_ACK = "Understood. I will use the tools above and reply with a final_answer block."
+
+# List results beyond this many items are cut from tool observations, which
+# are fed back into the next prompt
+MAX_OBSERVATION_ITEMS = 20
+
+# Tool call / final answer block in a model response
+JSON_BLOCK_PATTERN = re.compile(r"```json\s*(.*?)\s*```", re.DOTALL)
+
+
+GENERATION_CONFIG = {
+    "temperature": 0.1, # Low temperature for precise tool use
+    "max_output_tokens": 1024,
+}
+
+
 class DatabaseAgent:
     def __init__(self, tools: AgentTools):
-        genai.configure(api_key=settings.GEMINI_API_KEY)
-        self.model = GenerativeModel(
-            model_name=settings.GEMINI_MODEL_NAME,
-            generation_config={
-                "temperature": 0.1, # Low temperature for precise tool use
-                "max_output_tokens": 1024,
-            }
+        # Agents are built per request; the model itself is shared.
+        # With context caching the static prompt lives server-side and only
+        # the conversation is sent; otherwise it opens every request
+        cached_prompt = get_cached_content("database-agent", SYSTEM_PROMPT)
+        self.model = get_model(
+            settings.GEMINI_MODEL_NAME,
+            GENERATION_CONFIG,
+            cached_content=cached_prompt,
         )
+        if cached_prompt is not None:
+            self._prompt_prefix = []
+        else:
+            self._prompt_prefix = [
+                {"role": "user", "parts": [SYSTEM_PROMPT]},
+                {"role": "model", "parts": [SYSTEM_PROMPT_ACK]},
+            ]
         self.tools = tools
-        self.tool_definitions = self._get_tool_definitions()
-
-    def _get_tool_definitions(self) -> str:
-        return """
-        Available Tools:
-        - list_tasks(status: str = None, limit: int = 10): List tasks. status can be 'todo', 'in_progress', 'completed'.
-        - create_task(title: str, description: str = None, priority: str = 'medium', due_date: str = None): Create a task.
-        - delete_task(task_id: int): Delete a task by ID.
-        - complete_task(task_id: int): Mark a task as completed.
-        - search_tasks(query: str): Search tasks by text.
-        """
+        self.tool_definitions = TOOL_DEFINITIONS
+        # Whether the last run ended with an answer from the model, rather
+        # than an error or step-limit message
+        self.answered = False
 
     async def run(self, user_input: str, history: Optional[List[Any]] = None) -> str:
         """
         Run the ReAct loop with conversation history.
         """
+        self.answered = False
+
+        # Static prefix first, so every request shares the same head
+        messages = list(self._prompt_prefix)
+
         # Convert history to format expected by Gemini
-        messages = []
         if history:
             for msg in history:
                 messages.append({
@@ -47,8 +111,8 @@ class DatabaseAgent:
                     "parts": [msg.content]
                 })
         
-        # Add current user prompt
-        messages.append({"role": "user", "parts": [self._build_system_prompt(user_input)]})
+        # Add current user prompt; the only per-request part of the prompt
+        messages.append({"role": "user", "parts": [f'User Request: "{user_input}"']})
         
         max_turns = 5
         current_turn = 0
@@ -56,8 +120,7 @@ class DatabaseAgent:
         while current_turn < max_turns:
             try:
                 # Generate response from Gemini
-                response = await self.model.generate_content_async(messages)
-                response_text = response.text
+                response_text = await self._generate(messages)
             except ResourceExhausted:
                 return "I'm currently hitting my rate limit with the AI provider. Please wait a minute and try again."
             except GoogleAPIError as e:
@@ -69,7 +132,7 @@ class DatabaseAgent:
             print(f"Agent Step {current_turn}: {response_text}")
 
             # Check if Agent wants to perform an Action via JSON block
-            json_match = re.search(r"```json\s*(.*?)\s*```", response_text, re.DOTALL)
+            json_match = JSON_BLOCK_PATTERN.search(response_text)
             
             if json_match:
                 try:
@@ -78,6 +141,7 @@ class DatabaseAgent:
                     tool_args = action_data.get("args", {})
                     
                     if tool_name == "final_answer":
+                        self.answered = True
                         return tool_args.get("message", response_text)
 
                     # Execute Tool
@@ -92,48 +156,40 @@ class DatabaseAgent:
                     messages.append({"role": "user", "parts": [f"Observation: Error executing tool: {str(e)}"]})
             else:
                 # No action detected, return response as is (assuming it's a direct answer or conversation)
+                self.answered = True
                 return response_text
 
             current_turn += 1
         
         return "I tried to help but reached my limit of steps."
 
+    async def _generate(self, messages: List[Dict[str, Any]]) -> str:
+        """
+        Stream a model turn, stopping as soon as it contains a JSON block.
+
+        Anything the model writes after its tool call is discarded anyway,
+        so there is no need to wait for it to finish decoding.
+        """
+        response = await self.model.generate_content_async(messages, stream=True)
+        chunks: List[str] = []
+        async for chunk in response:
+            chunks.append(chunk.text)
+            if "`" in chunk.text and JSON_BLOCK_PATTERN.search("".join(chunks)):
+                break
+        return "".join(chunks)
+
     def _execute_tool(self, tool_name: str, args: Dict[str, Any]) -> str:
         try:
             method = getattr(self.tools, tool_name)
             result = method(**args)
-            return json.dumps(result, default=str)
+            if isinstance(result, list) and len(result) > MAX_OBSERVATION_ITEMS:
+                result = {
+                    "items": result[:MAX_OBSERVATION_ITEMS],
+                    "total": len(result),
+                    "truncated": True,
+                }
+            return orjson.dumps(result, default=str).decode()
         except AttributeError:
             return f"Tool {tool_name} not found."
         except Exception as e:
             return f"Error: {str(e)}"
-
-    def _build_system_prompt(self, user_input: str) -> str:
-        return f"""
-        You are a helpful task management assistant. You can access the user's database directly.
-        
-        {self.tool_definitions}
-        
-        To use a tool, output a JSON block like this:
-        ```json
-        {{
-            "tool": "create_task",
-            "args": {{
-                "title": "Buy milk",
-                "priority": "high"
-            }}
-        }}
-        ```
-        
-        When you have completed the request or need to reply to the user, use the 'final_answer' tool:
-        ```json
-        {{
-            "tool": "final_answer",
-            "args": {{
-                "message": "I have created the task for you."
-            }}
-        }}
-        ```
-        
-        User Request: "{user_input}"
-        """
@@ -5,31 +5,157 @@ Provides intelligent task analysis, priority suggestions, and
 productivity insights using Gemini's natural language capabilities.
 """
 
+import copy
 import json
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
-from google.generativeai import GenerativeModel
-import google.generativeai as genai
-
+import re
+import time
+from functools import lru_cache
+from typing import Dict, List, Literal, Optional, Any
+from datetime import datetime, timedelta, timezone
+from google.api_core.exceptions import ResourceExhausted
+from pydantic import BaseModel
+
+from app.core.cache import TTLCache, make_cache_key
 from app.core.config import settings
+from app.core.gemini import get_model, json_schema_config
 from app.models.task import Task, Priority, TaskStatus
 
 
+# Tasks whose description is shorter than this, or whose priority was set
+# explicitly (not left at medium), are analyzed with the rule-based path
+MIN_DESCRIPTION_LENGTH_FOR_LLM = 40
+
+# After the Gemini quota is exhausted, all methods use their rule-based
+# fallbacks for this many seconds instead of retrying the API
+QUOTA_COOLDOWN_SECONDS = 60
+
+_UTC = timezone.utc
+
+# Used when a task has no estimate of its own
+DEFAULT_DURATION_MINUTES = 60
+
+# Subtask suggestions beyond this many are dropped
+MAX_SUBTASKS = 7
+
+# A complete string element of a JSON array, up to its trailing , or ]
+SUBTASK_ITEM_PATTERN = re.compile(r'"((?:[^"\\]|\\.)*)"\s*[,\]]')
+
+
+def priority_from_due_date(due_date: Optional[datetime]) -> str:
+    """
+    Rule-based priority: high when due within a day, low when more than a
+    week away, medium otherwise or without a due date.
+    """
+    if not due_date:
+        return "medium"
+    # Due dates are stored as naive UTC
+    days_until_due = (due_date - datetime.now(_UTC).replace(tzinfo=None)).days
+    if days_until_due <= 1:
+        return "high"
+    if days_until_due > 7:
+        return "low"
+    return "medium"
+
+
+def estimate_task_duration(task: Task) -> int:
+    """Rule-based duration: the task's own estimate, or the default."""
+    return task.estimated_duration or DEFAULT_DURATION_MINUTES
+
+
+Level = Literal["low", "medium", "high"]
+
+
+class TaskAnalysis(BaseModel):
+    """Response schema for task analysis."""
+
+    suggested_priority: Level
+    estimated_duration_minutes: int
+    complexity: Level
+    recommendations: List[str]
+    reasoning: str
+
+
+class ProductivityInsights(BaseModel):
+    """Response schema for productivity insights."""
+
+    productivity_score: int
+    insights: List[str]
+    recommendations: List[str]
+    trend: Literal["improving", "stable", "declining"]
+
+
+class ScheduleSuggestion(BaseModel):
+    """Response schema for schedule suggestions."""
+
+    suggested_start_time: str
+    suggested_duration_minutes: int
+    reasoning: str
+    calendar_block_title: str
+
+
 class TaskIntelligenceAgent:
     """
     AI agent for task intelligence using Google Gemini API.
 
     Provides intelligent analysis of tasks, priority suggestions,
     productivity insights, and context-aware recommendations.
+
+    Each prompt is a constant instruction prefix followed by the per-call
+    data, so the provider can reuse its cached processing of the prefix.
     """
 
+    ANALYZE_TASK_PROMPT = """Analyze the task below and provide insights.
+
+Provide a JSON response with:
+- suggested_priority: "low", "medium", or "high"
+- estimated_duration_minutes: estimated time to complete (number)
+- complexity: "low", "medium", or "high"
+- recommendations: array of 2-3 actionable recommendations
+- reasoning: brief explanation of your analysis
+
+Be concise and practical.
+"""
+
+    PRODUCTIVITY_INSIGHTS_PROMPT = """Analyze the task statistics below and provide productivity insights.
+
+Provide a JSON response with:
+- productivity_score: number between 0-100
+- insights: array of 2-3 key observations
+- recommendations: array of 2-3 actionable suggestions
+- trend: "improving", "stable", or "declining"
+
+Be encouraging but honest.
+"""
+
+    TASK_BREAKDOWN_PROMPT = """Break down the complex task below into 3-7 manageable subtasks.
+
+Provide a JSON array of subtask titles. Each subtask should be:
+- Specific and actionable
+- Independent (can be done separately)
+- Clear and concise (max 10 words)
+- Following a logical sequence
+
+Example format: ["Research requirements", "Create draft outline", "Write first section"]
+
+Return only the JSON array, nothing else.
+"""
+
+    SCHEDULE_PROMPT = """Suggest the best time to work on the task below.
+
+Provide a JSON response with:
+- suggested_start_time: ISO format string
+- suggested_duration_minutes: number
+- reasoning: why this time was chosen
+- calendar_block_title: title for calendar event
+
+Focus on productivity principles (e.g., deep work in morning for hard tasks).
+"""
+
     def __init__(self):
         """Initialize the Task Intelligence Agent with Gemini."""
-        genai.configure(api_key=settings.GEMINI_API_KEY)
-
-        self.model = GenerativeModel(
-            model_name=settings.GEMINI_MODEL_NAME,
-            generation_config={
+        self.model = get_model(
+            settings.GEMINI_MODEL_NAME,
+            {
                 "temperature": settings.AI_TEMPERATURE,
                 "top_p": 0.95,
                 "top_k": 40,
@@ -38,6 +164,44 @@ class TaskIntelligenceAgent:
             },
         )
 
+        # Constrained decoding configs; None when the SDK lacks support, in
+        # which case the prompt's format instructions alone apply
+        self._analysis_config = json_schema_config(TaskAnalysis)
+        self._insights_config = json_schema_config(ProductivityInsights)
+        self._breakdown_config = json_schema_config(List[str])
+        self._schedule_config = json_schema_config(ScheduleSuggestion)
+
+        # Successful model results keyed by a hash of their inputs; fallback
+        # results are never cached so a transient failure is retried
+        self._result_cache = TTLCache(
+            maxsize=settings.LLM_CACHE_MAX_SIZE,
+            ttl=settings.LLM_CACHE_TTL,
+        )
+
+        # time.monotonic() until which the model is not called
+        self._llm_paused_until = 0.0
+
+    def _llm_available(self) -> bool:
+        """Whether the model may be called (no quota cooldown in effect)."""
+        return time.monotonic() >= self._llm_paused_until
+
+    def _handle_llm_error(self, error: Exception) -> None:
+        """Start a quota cooldown if error is a rate-limit error."""
+        if isinstance(error, ResourceExhausted):
+            self._llm_paused_until = time.monotonic() + QUOTA_COOLDOWN_SECONDS
+
+    @staticmethod
+    def _task_key(kind: str, task: Task) -> str:
+        """Cache key for a result derived from the task's content."""
+        return make_cache_key(
+            kind,
+            task.title,
+            task.description,
+            task.priority.value,
+            task.due_date,
+            task.status.value,
+        )
+
     async def analyze_task(
         self,
         task: Task,
@@ -53,33 +217,49 @@ class TaskIntelligenceAgent:
         Returns:
             Dictionary with analysis results and recommendations
         """
-        prompt = f"""Analyze this task and provide insights:
+        # Short or explicitly prioritized tasks gain little from the model;
+        # the due-date rules answer them without a round trip
+        needs_llm = (
+            task.priority == Priority.MEDIUM
+            and len(task.description or "") > MIN_DESCRIPTION_LENGTH_FOR_LLM
+        )
+        if not needs_llm or not self._llm_available():
+            return self._fallback_analysis(task)
 
+        prompt = self.ANALYZE_TASK_PROMPT + f"""
 Task Title: {task.title}
 Description: {task.description or 'No description'}
 Current Priority: {task.priority.value}
 Due Date: {task.due_date.isoformat() if task.due_date else 'Not set'}
 Status: {task.status.value}
+"""
 
-Provide a JSON response with:
-- suggested_priority: "low", "medium", or "high"
-- estimated_duration_minutes: estimated time to complete (number)
-- complexity: "low", "medium", or "high"
-- recommendations: array of 2-3 actionable recommendations
-- reasoning: brief explanation of your analysis
-
-Be concise and practical."""
+        cache_key = self._task_key("analysis", task)
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
 
         try:
-            response = await self.model.generate_content_async(prompt)
+            response = await self.model.generate_content_async(
+                prompt, generation_config=self._analysis_config
+            )
             analysis = json.loads(response.text)
 
-            return {
+            # Fields the model left out are filled in by the rules
+            result = {
                 "analysis": analysis,
-                "suggested_priority": analysis.get("suggested_priority"),
-                "estimated_duration": analysis.get("estimated_duration_minutes"),
+                "suggested_priority": (
+                    analysis.get("suggested_priority") or priority_from_due_date(task.due_date)
+                ),
+                "estimated_duration": (
+                    analysis.get("estimated_duration_minutes") or estimate_task_duration(task)
+                ),
             }
+            # Callers own the returned dict; the cache keeps its own copy
+            self._result_cache.set(cache_key, copy.deepcopy(result))
+            return result
         except Exception as e:
+            self._handle_llm_error(e)
             print(f"Analysis failed: {e}. Using fallback.")
             return self._fallback_analysis(task)
 
@@ -96,8 +276,7 @@ Be concise and practical."""
         Returns:
             Dictionary with insights and recommendations
         """
-        prompt = f"""Analyze these task statistics and provide productivity insights:
-
+        prompt = self.PRODUCTIVITY_INSIGHTS_PROMPT + f"""
 Statistics:
 - Total Tasks: {task_statistics.get('total', 0)}
 - Completed: {task_statistics.get('completed', 0)}
@@ -105,26 +284,31 @@ Statistics:
 - Todo: {task_statistics.get('todo', 0)}
 - Overdue: {task_statistics.get('overdue', 0)}
 - Completion Rate: {task_statistics.get('completion_rate', 0)}%
+"""
 
-Provide a JSON response with:
-- productivity_score: number between 0-100
-- insights: array of 2-3 key observations
-- recommendations: array of 2-3 actionable suggestions
-- trend: "improving", "stable", or "declining"
-
-Be encouraging but honest."""
+        cache_key = make_cache_key("insights", task_statistics)
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        if not self._llm_available():
+            return self._fallback_insights(task_statistics)
 
         try:
-            response = await self.model.generate_content_async(prompt)
+            response = await self.model.generate_content_async(
+                prompt, generation_config=self._insights_config
+            )
             insights = json.loads(response.text)
 
-            return {
+            result = {
                 "insights": insights.get("insights", []),
                 "recommendations": insights.get("recommendations", []),
                 "productivity_score": insights.get("productivity_score", 50),
                 "trend": insights.get("trend", "stable")
             }
+            self._result_cache.set(cache_key, copy.deepcopy(result))
+            return result
         except Exception as e:
+            self._handle_llm_error(e)
             print(f"Insights generation failed: {e}. Using fallback.")
             return self._fallback_insights(task_statistics)
 
@@ -143,32 +327,50 @@ Be encouraging but honest."""
         Returns:
             List of suggested subtask titles
         """
-        prompt = f"""Break down this complex task into 3-7 manageable subtasks:
-
+        prompt = self.TASK_BREAKDOWN_PROMPT + f"""
 Task: {task_title}
 Description: {task_description}
+"""
 
-Provide a JSON array of subtask titles. Each subtask should be:
-- Specific and actionable
-- Independent (can be done separately)
-- Clear and concise (max 10 words)
-- Following a logical sequence
-
-Example format: ["Research requirements", "Create draft outline", "Write first section"]
-
-Return only the JSON array, nothing else."""
+        cache_key = make_cache_key("breakdown", task_title, task_description)
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+        if not self._llm_available():
+            return self._fallback_breakdown(task_title)
 
         try:
-            response = await self.model.generate_content_async(prompt)
-            subtasks = json.loads(response.text)
+            subtasks = await self._stream_subtasks(prompt)
 
             if isinstance(subtasks, list):
-                return subtasks[:7]  # Limit to 7
+                subtasks = subtasks[:MAX_SUBTASKS]
+                self._result_cache.set(cache_key, subtasks)
+                return list(subtasks)
             return []
         except Exception as e:
+            self._handle_llm_error(e)
             print(f"Task breakdown failed: {e}. Using fallback.")
             return self._fallback_breakdown(task_title)
 
+    async def _stream_subtasks(self, prompt: str) -> Any:
+        """
+        Stream the breakdown response, stopping once enough subtasks arrived.
+
+        Returns the decoded JSON array when the stream completes, or the
+        first MAX_SUBTASKS complete items when it is cut short; anything the
+        model would generate past them is never decoded.
+        """
+        response = await self.model.generate_content_async(
+            prompt, generation_config=self._breakdown_config, stream=True
+        )
+        buffer = ""
+        async for chunk in response:
+            buffer += chunk.text
+            items = SUBTASK_ITEM_PATTERN.findall(buffer)
+            if len(items) >= MAX_SUBTASKS:
+                return [json.loads(f'"{item}"') for item in items[:MAX_SUBTASKS]]
+        return json.loads(buffer)
+
     async def suggest_schedule(
         self,
         task: Task,
@@ -185,51 +387,39 @@ Return only the JSON array, nothing else."""
             Dictionary with schedule suggestion
         """
         now = datetime.now()
-        prompt = f"""Suggest the best time to work on this task:
+        if not self._llm_available():
+            return self._fallback_schedule(task, now)
 
+        prompt = self.SCHEDULE_PROMPT + f"""
 Task: {task.title}
 Description: {task.description or 'None'}
 Priority: {task.priority.value}
 Due Date: {task.due_date if task.due_date else 'None'}
-Current Time: {now.isoformat()}
 User Context: {user_context or 'Standard 9-5 work hours'}
-
-Provide a JSON response with:
-- suggested_start_time: ISO format string
-- suggested_duration_minutes: number
-- reasoning: why this time was chosen
-- calendar_block_title: title for calendar event
-
-Focus on productivity principles (e.g., deep work in morning for hard tasks)."""
+Current Time: {now.isoformat()}
+"""
 
         try:
-            response = await self.model.generate_content_async(prompt)
+            response = await self.model.generate_content_async(
+                prompt, generation_config=self._schedule_config
+            )
             suggestion = json.loads(response.text)
             return suggestion
         except Exception as e:
+            self._handle_llm_error(e)
             print(f"Scheduling suggestion failed: {e}. Using fallback.")
-            return {
-                "suggested_start_time": (now + timedelta(days=1)).replace(hour=9, minute=0).isoformat(),
-                "suggested_duration_minutes": 60,
-                "reasoning": "Fallback to tomorrow morning",
-                "calendar_block_title": f"Work on {task.title}"
-            }
+            return self._fallback_schedule(task, now)
 
     def _fallback_analysis(self, task: Task) -> Dict[str, Any]:
         """Fallback analysis when AI fails."""
         # Simple rule-based analysis
-        priority = "medium"
-        if task.due_date:
-            days_until_due = (task.due_date - datetime.utcnow()).days
-            if days_until_due <= 1:
-                priority = "high"
-            elif days_until_due > 7:
-                priority = "low"
+        priority = priority_from_due_date(task.due_date)
+        duration = estimate_task_duration(task)
 
         return {
             "analysis": {
                 "suggested_priority": priority,
-                "estimated_duration_minutes": 60,
+                "estimated_duration_minutes": duration,
                 "complexity": "medium",
                 "recommendations": [
                     "Break down into smaller subtasks",
@@ -238,7 +428,7 @@ Focus on productivity principles (e.g., deep work in morning for hard tasks)."""
                 "reasoning": "Based on due date analysis"
             },
             "suggested_priority": priority,
-            "estimated_duration": 60
+            "estimated_duration": duration
         }
 
     def _fallback_insights(self, stats: Dict[str, int]) -> Dict[str, Any]:
@@ -265,6 +455,15 @@ Focus on productivity principles (e.g., deep work in morning for hard tasks)."""
             "trend": "stable"
         }
 
+    def _fallback_schedule(self, task: Task, now: datetime) -> Dict[str, Any]:
+        """Fallback schedule suggestion when AI fails."""
+        return {
+            "suggested_start_time": (now + timedelta(days=1)).replace(hour=9, minute=0).isoformat(),
+            "suggested_duration_minutes": 60,
+            "reasoning": "Fallback to tomorrow morning",
+            "calendar_block_title": f"Work on {task.title}"
+        }
+
     def _fallback_breakdown(self, task_title: str) -> List[str]:
         """Fallback task breakdown when AI fails."""
         return [
@@ -274,5 +473,15 @@ Focus on productivity principles (e.g., deep work in morning for hard tasks)."""
         ]
 
 
-# Singleton instance
-task_intelligence_agent = TaskIntelligenceAgent()
+@lru_cache
+def get_task_intelligence_agent() -> TaskIntelligenceAgent:
+    """
+    Get the shared task intelligence agent, creating it on first use.
+
+    The instance (and its result cache) lives for the rest of the process.
+
+    Returns:
+        TaskIntelligenceAgent instance
+    """
+    return TaskIntelligenceAgent()
+
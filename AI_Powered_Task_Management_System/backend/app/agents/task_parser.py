@@ -5,13 +5,258 @@ Parses user input in natural language and extracts structured task information
 including title, description, due date, priority, and tags.
 """
 
+import asyncio
+import json
 import re
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
-from google.generativeai import GenerativeModel
-import google.generativeai as genai
+import unicodedata
+from functools import lru_cache
+from itertools import islice
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple, Union
+
+import orjson
 from app.schemas.task import TaskCreate
+from app.core.cache import get_llm_cache, make_cache_key
 from app.core.config import settings
+from app.core.gemini import get_model
+
+
+GENERATION_CONFIG = {
+    "temperature": 0.3,
+    "top_p": 0.95,
+    "top_k": 40,
+    "max_output_tokens": 512,
+    "response_mime_type": "application/json",
+}
+
+# Batch responses hold one task per input, so they need far more room
+BATCH_GENERATION_CONFIG = {**GENERATION_CONFIG, "max_output_tokens": 8192}
+
+# Inputs sent to Gemini per parse_many request
+PARSE_BATCH_SIZE = 32
+
+# Instructions and examples are fixed text (the examples assume a fixed
+# "today"), so every prompt starts with the same prefix and only the date,
+# user context and input at the end vary.
+PARSING_INSTRUCTIONS = """
+You are an intelligent task parsing assistant. Your job is to extract structured task information from natural language input.
+
+Extract the following information:
+- title: Main task title (concise, actionable)
+- description: Full task description
+- due_date: ISO format date string (YYYY-MM-DDTHH:MM:SS) or null if no specific date mentioned
+- priority: "low", "medium", or "high" (default to "medium" if unclear)
+- tags: Array of relevant tags (2-5 tags max)
+- estimated_duration: Estimated duration in minutes (null if not specified)
+
+Examples (assuming today is Tuesday, 2025-01-14):
+Input: "Remind me to call John tomorrow at 2pm about the project"
+Output: {{
+    "title": "Call John about the project",
+    "description": "Remind to call John tomorrow at 2pm about the project",
+    "due_date": "2025-01-15T14:00:00",
+    "priority": "medium",
+    "tags": ["communication", "project"],
+    "estimated_duration": 30
+}}
+
+Input: "Finish the quarterly report by Friday"
+Output: {{
+    "title": "Finish the quarterly report",
+    "description": "Finish the quarterly report by Friday",
+    "due_date": "2025-01-17T23:59:59",
+    "priority": "high",
+    "tags": ["work", "report", "deadline"],
+    "estimated_duration": 240
+}}
+
+Input: "Buy groceries on the way home"
+Output: {{
+    "title": "Buy groceries",
+    "description": "Buy groceries on the way home",
+    "due_date": null,
+    "priority": "medium",
+    "tags": ["errand", "shopping"],
+    "estimated_duration": 60
+}}
+"""
+
+PARSING_PROMPT_TEMPLATE = PARSING_INSTRUCTIONS + """
+Today is {weekday}, {today}.
+{context}
+Now parse this input: "{user_input}"
+"""
+
+BATCH_PARSING_PROMPT_TEMPLATE = PARSING_INSTRUCTIONS + """
+Today is {weekday}, {today}.
+{context}
+Parse each numbered input below. Return a JSON array with exactly one task
+object per input, in the same order.
+{inputs}
+"""
+
+CONTEXT_TEMPLATE = """
+User Context:
+- Work Hours: {work_hours}
+- Preferred Priority: {default_priority}
+- Common Categories: {categories}
+- Recent Tasks: {recent_tasks}
+"""
+
+@lru_cache(maxsize=1024)
+def format_user_context(work_hours, default_priority, categories, recent_tasks) -> str:
+    """
+    Render CONTEXT_TEMPLATE, reusing the text for repeated contexts.
+
+    A user sending several tasks in a row has the same context each time,
+    so the block is formatted once. Lists must be passed as tuples (see
+    _hashable); they are shown as lists, as in the original context.
+    """
+    return CONTEXT_TEMPLATE.format(
+        work_hours=work_hours,
+        default_priority=default_priority,
+        categories=list(categories) if isinstance(categories, tuple) else categories,
+        recent_tasks=list(recent_tasks) if isinstance(recent_tasks, tuple) else recent_tasks,
+    )
+
+
+def _hashable(value):
+    """Convert a list context value to a tuple so it can be a cache key."""
+    return tuple(value) if isinstance(value, list) else value
+
+
+# Markdown code fence (with or without a json tag) around a model response
+CODE_FENCE_PATTERN = re.compile(r'^\s*```(?:json)?\s*|\s*```\s*$')
+
+# Patterns for rule-based parsing, compiled once
+RELATIVE_OFFSET_PATTERN = re.compile(r'in (\d+) (hour|hours|day|days|week|weeks|month|months)')
+DURATION_PATTERN = re.compile(r'(\d+)\s*(hour|hours|min|minutes?)')
+# Time and relative-day phrases removed from titles
+TITLE_STRIP_PATTERN = re.compile(
+    r'\b(?:at|on|by|in)\s+\d+(?::\d+)?\s*(?:am|pm|hours?|days?|weeks?)?\b'
+    r'|\b(?:tomorrow|today|tonight|yesterday)\b',
+    re.IGNORECASE,
+)
+TITLE_WORD_PATTERN = re.compile(r'\S+')
+
+WEEKDAYS = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+
+# Keyword tables for rule-based parsing. Tag and duration keywords match as
+# substrings of the lowercased input; priority keywords match whole words
+# (so "know" does not count as "now"), or the whole phrase for multi-word
+# keywords.
+TAG_KEYWORDS = {
+    'work': ('meeting', 'email', 'project', 'report', 'presentation', 'work', 'office'),
+    'communication': ('call', 'email', 'message', 'contact', 'phone', 'text'),
+    'errands': ('buy', 'shop', 'grocery', 'store', 'purchase', 'errand'),
+    'health': ('doctor', 'appointment', 'exercise', 'workout', 'health', 'medical'),
+    'personal': ('personal', 'home', 'family', 'friend'),
+}
+
+PRIORITY_KEYWORDS = {
+    'high': (
+        'urgent', 'asap', 'immediately', 'now', 'today', 'deadline',
+        'important', 'critical', 'emergency', 'crucial', 'priority'
+    ),
+    'low': (
+        'later', 'whenever', 'eventually', 'maybe', 'someday',
+        'when convenient', 'at leisure'
+    ),
+}
+
+# Checked in order; the first task type with a matching keyword wins
+DURATION_KEYWORDS = (
+    (60, ('meeting', 'call', 'interview')),  # 1 hour
+    (15, ('email', 'message', 'reply')),  # 15 minutes
+    (120, ('report', 'analysis', 'research')),  # 2 hours
+    (90, ('shopping', 'errand')),  # 1.5 hours
+    (60, ('exercise', 'workout')),  # 1 hour
+)
+
+
+@lru_cache(maxsize=1)
+def days_ahead_by_weekday(today_ordinal: int) -> Tuple[int, ...]:
+    """
+    Days from the given day to the next Monday, Tuesday, ... Sunday.
+
+    Today's own weekday maps to 7 (next week's occurrence). Computed once
+    per day.
+    """
+    weekday = date.fromordinal(today_ordinal).weekday()  # Monday is 0
+    return tuple((i - weekday) % 7 or 7 for i in range(7))
+
+
+def canonical_input(text: str) -> str:
+    """
+    Reduce text to its case-folded words, in order, separated by single spaces.
+
+    "Call John at 2pm  tomorrow!" and "call john at 2pm tomorrow" give the
+    same result, so inputs differing only in casing, punctuation or spacing
+    share a parse cache entry. Word order and repeats are kept: "in 2 days
+    for 10 minutes" and "in 10 days for 2 minutes" are different inputs.
+    Works on any script: only Unicode punctuation (other than apostrophes)
+    and whitespace are dropped, so non-Latin text keeps all its letters and
+    marks. Non-blank input never reduces to an empty string.
+    """
+    folded = unicodedata.normalize('NFKC', text).casefold()
+    words = ''.join(
+        ' ' if char != "'" and unicodedata.category(char).startswith('P') else char
+        for char in folded
+    ).split()
+    return ' '.join(words or folded.split())
+
+
+# (table, entry) pair, e.g. ('priority', 'high'), to number of matching keywords
+KeywordHits = Dict[Tuple[str, object], int]
+
+
+WORD_PATTERN = re.compile(r"[a-z0-9']+")
+
+# level -> (single-word keywords, multi-word phrases)
+_PRIORITY_MATCHERS = tuple(
+    (
+        level,
+        frozenset(keyword for keyword in keywords if ' ' not in keyword),
+        tuple(keyword for keyword in keywords if ' ' in keyword),
+    )
+    for level, keywords in PRIORITY_KEYWORDS.items()
+)
+
+
+def _build_keyword_buckets() -> Tuple[Tuple[str, Tuple[Tuple[str, object], ...]], ...]:
+    """Map each distinct substring keyword to every (table, entry) it belongs to."""
+    buckets: Dict[str, List[Tuple[str, object]]] = {}
+    for tag, keywords in TAG_KEYWORDS.items():
+        for keyword in keywords:
+            buckets.setdefault(keyword, []).append(('tag', tag))
+    for index, (_, keywords) in enumerate(DURATION_KEYWORDS):
+        for keyword in keywords:
+            buckets.setdefault(keyword, []).append(('duration', index))
+    return tuple((keyword, tuple(entries)) for keyword, entries in buckets.items())
+
+
+_KEYWORD_BUCKETS = _build_keyword_buckets()
+
+
+def match_keywords(text_lower: str) -> KeywordHits:
+    """
+    Scan lowercased text once for every rule-based keyword.
+
+    Returns:
+        Number of distinct matching keywords per (table, entry) pair
+    """
+    hits: KeywordHits = {}
+    for keyword, buckets in _KEYWORD_BUCKETS:
+        if keyword in text_lower:
+            for bucket in buckets:
+                hits[bucket] = hits.get(bucket, 0) + 1
+
+    words = set(WORD_PATTERN.findall(text_lower))
+    for level, single_words, phrases in _PRIORITY_MATCHERS:
+        count = len(single_words & words) + sum(1 for phrase in phrases if phrase in text_lower)
+        if count:
+            hits[('priority', level)] = count
+    return hits
 
 
 class TaskParserAgent:
@@ -22,17 +267,7 @@ class TaskParserAgent:
 
     def __init__(self):
         """Initialize the Gemini model for task parsing."""
-        genai.configure(api_key=settings.GEMINI_API_KEY)
-        self.model = GenerativeModel(
-            model_name=settings.GEMINI_MODEL_NAME,
-            generation_config={
-                "temperature": 0.3,
-                "top_p": 0.95,
-                "top_k": 40,
-                "max_output_tokens": 512,
-                "response_mime_type": "application/json",
-            },
-        )
+        self.model = get_model(settings.GEMINI_MODEL_NAME, GENERATION_CONFIG)
 
     async def parse_natural_language_task(self, user_input: str, user_context: Optional[Dict] = None) -> TaskCreate:
         """
@@ -55,6 +290,12 @@ class TaskParserAgent:
                 tags=["communication", "project"]
             )
         """
+        llm_cache = get_llm_cache()
+        cache_key = self._cache_key(user_input, user_context)
+        cached = await llm_cache.get(cache_key)
+        if cached is not None:
+            return TaskCreate(**cached)
+
         # Prepare the prompt for Gemini
         prompt = self._build_parsing_prompt(user_input, user_context)
 
@@ -62,121 +303,198 @@ class TaskParserAgent:
             response = await self.model.generate_content_async(prompt)
 
             # Parse the JSON response from Gemini
-            parsed_data = self._parse_gemini_response(response.text)
+            try:
+                parsed_data = self._load_response_json(response.text)
+                cacheable = True
+            except json.JSONDecodeError:
+                parsed_data = self._unparsed_response(response.text)
+                cacheable = False
 
             # Create and return TaskCreate object
-            return TaskCreate(**parsed_data)
+            task = TaskCreate(**parsed_data)
+            if cacheable:
+                await llm_cache.set(cache_key, parsed_data)
+            return task
 
         except Exception as e:
             # Fallback to rule-based parsing if Gemini fails
             print(f"Gemini parsing failed: {e}. Falling back to rule-based parsing.")
             return self._rule_based_parse(user_input)
 
-    def _build_parsing_prompt(self, user_input: str, user_context: Optional[Dict]) -> str:
+    async def parse_many(self, inputs: List[str], user_context: Optional[Dict] = None) -> List[TaskCreate]:
         """
-        Build the prompt for Gemini with context and examples.
+        Parse several natural language inputs, e.g. for a bulk import.
+
+        Cached inputs are answered from the cache; the rest are sent to
+        Gemini PARSE_BATCH_SIZE at a time, one request per batch, instead of
+        one request per input.
+
+        Args:
+            inputs: Natural language task descriptions
+            user_context: Optional user context shared by all inputs
+
+        Returns:
+            One TaskCreate per input, in input order
         """
-        context_str = ""
-        if user_context:
-            context_str = f"""
-            User Context:
-            - Work Hours: {user_context.get('work_hours', 'N/A')}
-            - Preferred Priority: {user_context.get('default_priority', 'medium')}
-            - Common Categories: {user_context.get('common_task_categories', [])}
-            - Recent Tasks: {user_context.get('recent_tasks', [])}
-            """
-
-        prompt = f"""
-        You are an intelligent task parsing assistant. Your job is to extract structured task information from natural language input.
-
-        {context_str}
-
-        Extract the following information:
-        - title: Main task title (concise, actionable)
-        - description: Full task description
-        - due_date: ISO format date string (YYYY-MM-DDTHH:MM:SS) or null if no specific date mentioned
-        - priority: "low", "medium", or "high" (default to "medium" if unclear)
-        - tags: Array of relevant tags (2-5 tags max)
-        - estimated_duration: Estimated duration in minutes (null if not specified)
-
-        Examples:
-        Input: "Remind me to call John tomorrow at 2pm about the project"
-        Output: {{
-            "title": "Call John about the project",
-            "description": "Remind to call John tomorrow at 2pm about the project",
-            "due_date": "{(datetime.now() + timedelta(days=1)).strftime('%Y-%m-%dT14:00:00')}",
-            "priority": "medium",
-            "tags": ["communication", "project"],
-            "estimated_duration": 30
-        }}
-
-        Input: "Finish the quarterly report by Friday"
-        Output: {{
-            "title": "Finish the quarterly report",
-            "description": "Finish the quarterly report by Friday",
-            "due_date": "{(datetime.now() + timedelta(days=(4-datetime.now().weekday()) % 7)).strftime('%Y-%m-%dT23:59:59')}",
-            "priority": "high",
-            "tags": ["work", "report", "deadline"],
-            "estimated_duration": 240
-        }}
-
-        Input: "Buy groceries on the way home"
-        Output: {{
-            "title": "Buy groceries",
-            "description": "Buy groceries on the way home",
-            "due_date": null,
-            "priority": "medium",
-            "tags": ["errand", "shopping"],
-            "estimated_duration": 60
-        }}
+        llm_cache = get_llm_cache()
+        cache_keys = [self._cache_key(user_input, user_context) for user_input in inputs]
+        results: List[Optional[TaskCreate]] = [None] * len(inputs)
+        misses = []
+        for index, cache_key in enumerate(cache_keys):
+            cached = await llm_cache.get(cache_key)
+            if cached is not None:
+                results[index] = TaskCreate(**cached)
+            else:
+                misses.append(index)
+
+        batches = [misses[i:i + PARSE_BATCH_SIZE] for i in range(0, len(misses), PARSE_BATCH_SIZE)]
+        parsed_batches = await asyncio.gather(*(
+            self._parse_batch([inputs[index] for index in batch], user_context)
+            for batch in batches
+        ))
+
+        for batch, parsed in zip(batches, parsed_batches):
+            for index, (task, parsed_data) in zip(batch, parsed):
+                results[index] = task
+                if parsed_data is not None:
+                    await llm_cache.set(cache_keys[index], parsed_data)
+        return results
+
+    async def _parse_batch(
+        self, inputs: List[str], user_context: Optional[Dict]
+    ) -> List[Tuple[TaskCreate, Optional[Dict]]]:
+        """
+        Parse one batch with a single Gemini request.
 
-        Now parse this input: "{user_input}"
+        Returns (task, cacheable data) per input; the data is None for
+        inputs that fell back to rule-based parsing.
         """
+        prompt = self._build_parsing_prompt(inputs, user_context)
+        try:
+            response = await self.model.generate_content_async(
+                prompt, generation_config=BATCH_GENERATION_CONFIG
+            )
+            items = self._load_response_json(response.text)
+            if not isinstance(items, list) or len(items) != len(inputs):
+                raise ValueError(f"expected {len(inputs)} tasks in the response")
+        except Exception as e:
+            print(f"Gemini batch parsing failed: {e}. Falling back to rule-based parsing.")
+            return [(self._rule_based_parse(user_input), None) for user_input in inputs]
+
+        parsed = []
+        for user_input, item in zip(inputs, items):
+            try:
+                parsed.append((TaskCreate(**item), item))
+            except Exception:
+                parsed.append((self._rule_based_parse(user_input), None))
+        return parsed
+
+    def _cache_key(self, user_input: str, user_context: Optional[Dict]) -> str:
+        """
+        Cache key of a parse result.
 
-        return prompt
+        Inputs with the same words in the same order share an entry,
+        regardless of casing, punctuation or spacing.
+        Relative dates ("tomorrow") resolve against today, so the date is
+        part of the key.
+        """
+        return make_cache_key(
+            "task-parser",
+            settings.GEMINI_MODEL_NAME,
+            GENERATION_CONFIG,
+            canonical_input(user_input),
+            user_context,
+            datetime.now().date(),
+        )
+
+    def _build_parsing_prompt(self, user_input: Union[str, List[str]], user_context: Optional[Dict]) -> str:
+        """
+        Build the prompt for Gemini with context and examples.
+
+        A list of inputs gives the batch prompt asking for a JSON array.
+        """
+        context_str = ""
+        if user_context:
+            fields = (
+                user_context.get('work_hours', 'N/A'),
+                user_context.get('default_priority', 'medium'),
+                _hashable(user_context.get('common_task_categories', [])),
+                _hashable(user_context.get('recent_tasks', [])),
+            )
+            try:
+                context_str = format_user_context(*fields)
+            except TypeError:
+                # Values that cannot be hashed are formatted without caching
+                context_str = format_user_context.__wrapped__(*fields)
+
+        now = datetime.now()
+        if isinstance(user_input, list):
+            return BATCH_PARSING_PROMPT_TEMPLATE.format(
+                today=now.strftime('%Y-%m-%d'),
+                weekday=now.strftime('%A'),
+                context=context_str,
+                inputs="\n".join(
+                    f'{number}. "{text}"' for number, text in enumerate(user_input, 1)
+                ),
+            )
+        return PARSING_PROMPT_TEMPLATE.format(
+            today=now.strftime('%Y-%m-%d'),
+            weekday=now.strftime('%A'),
+            context=context_str,
+            user_input=user_input,
+        )
 
     def _parse_gemini_response(self, response_text: str) -> Dict:
         """
         Parse the JSON response from Gemini and return a dictionary.
         """
-        import json
-
         try:
-            # Clean up the response if it contains markdown code blocks
-            cleaned_response = response_text.strip()
-            if cleaned_response.startswith('```json'):
-                cleaned_response = cleaned_response[7:]  # Remove ```json
-            if cleaned_response.endswith('```'):
-                cleaned_response = cleaned_response[:-3]  # Remove ```
-
-            parsed = json.loads(cleaned_response)
-            return parsed
+            return self._load_response_json(response_text)
         except json.JSONDecodeError:
-            # If JSON parsing fails, return a minimal structure
-            return {
-                "title": "Parsed Task",
-                "description": response_text[:200],
-                "due_date": None,
-                "priority": "medium",
-                "tags": ["general"],
-                "estimated_duration": None
-            }
+            return self._unparsed_response(response_text)
+
+    def _load_response_json(self, response_text: str) -> Dict:
+        """
+        Decode Gemini's JSON response, raising JSONDecodeError if invalid.
+        """
+        # Clean up the response if it contains markdown code blocks;
+        # orjson.JSONDecodeError is a json.JSONDecodeError
+        return orjson.loads(CODE_FENCE_PATTERN.sub('', response_text))
+
+    def _unparsed_response(self, response_text: str) -> Dict:
+        """
+        Minimal task structure used when the response is not valid JSON.
+        """
+        return {
+            "title": "Parsed Task",
+            "description": response_text[:200],
+            "due_date": None,
+            "priority": "medium",
+            "tags": ["general"],
+            "estimated_duration": None
+        }
 
     def _rule_based_parse(self, user_input: str) -> TaskCreate:
         """
         Fallback rule-based parsing when Gemini fails.
         """
+        # Lowercase once for all keyword and pattern matching
+        text_lower = user_input.lower()
+
         # Extract due dates using regex patterns
-        due_date = self._extract_due_date(user_input)
+        due_date = self._extract_due_date(text_lower)
+
+        # One keyword scan shared by priority, tags and duration
+        keyword_hits = match_keywords(text_lower)
 
         # Determine priority based on urgency keywords
-        priority = self._determine_priority(user_input)
+        priority = self._determine_priority(text_lower, keyword_hits)
 
         # Extract title (first part of the sentence)
         title = self._extract_title(user_input)
 
         # Generate tags based on keywords
-        tags = self._generate_tags(user_input)
+        tags = self._generate_tags(text_lower, keyword_hits)
 
         return TaskCreate(
             title=title,
@@ -184,79 +502,54 @@ class TaskParserAgent:
             due_date=due_date,
             priority=priority,
             tags=tags,
-            estimated_duration=self._estimate_duration(user_input)
+            estimated_duration=self._estimate_duration(text_lower, keyword_hits)
         )
 
-    def _extract_due_date(self, text: str) -> Optional[datetime]:
+    def _extract_due_date(self, text_lower: str) -> Optional[datetime]:
         """
-        Extract due date using regex patterns.
+        Extract due date from lowercased text using regex patterns.
         """
-        # Patterns for different date formats
-        patterns = [
-            r'today',
-            r'tomorrow',
-            r'in (\d+) (hour|hours|day|days|week|weeks|month|months)',
-            r'on (\d{1,2}[/-]\d{1,2}(?:/\d{2,4})?)',
-            r'by (\d{1,2}[/-]\d{1,2}(?:/\d{2,4})?)',
-            r'at (\d{1,2}:\d{2}\s?(?:AM|PM|am|pm)?)',
-            r'(monday|tuesday|wednesday|thursday|friday|saturday|sunday)(?:\s+(this|next))?',
-            r'(january|february|march|april|may|june|july|august|september|october|november|december)\s+(\d{1,2})'
-        ]
-
-        text_lower = text.lower()
+        # Read the clock once; date-only results are midnight-based
+        now = datetime.now()
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
 
         # Handle "today" and "tomorrow"
         if 'today' in text_lower:
-            return datetime.combine(datetime.now().date(), datetime.min.time())
+            return midnight
         elif 'tomorrow' in text_lower:
-            return datetime.combine((datetime.now() + timedelta(days=1)).date(), datetime.min.time())
+            return midnight + timedelta(days=1)
 
         # Handle days of the week
-        days = ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday']
-        for i, day in enumerate(days):
+        for i, day in enumerate(WEEKDAYS):
             if day in text_lower:
-                current_weekday = datetime.now().weekday()  # Monday is 0
-                days_ahead = (i - current_weekday) % 7
-                if days_ahead == 0:  # Today
-                    days_ahead = 7  # Next occurrence
-                return datetime.combine((datetime.now() + timedelta(days=days_ahead)).date(), datetime.min.time())
+                return midnight + timedelta(days=days_ahead_by_weekday(now.toordinal())[i])
 
         # Handle "in X days/hours" patterns
-        in_pattern = r'in (\d+) (hour|hours|day|days|week|weeks|month|months)'
-        match = re.search(in_pattern, text_lower)
+        match = RELATIVE_OFFSET_PATTERN.search(text_lower)
         if match:
             num = int(match.group(1))
             unit = match.group(2)
             if 'hour' in unit:
-                return datetime.now() + timedelta(hours=num)
+                return now + timedelta(hours=num)
             elif 'day' in unit:
-                return datetime.combine((datetime.now() + timedelta(days=num)).date(), datetime.min.time())
+                return midnight + timedelta(days=num)
             elif 'week' in unit:
-                return datetime.combine((datetime.now() + timedelta(weeks=num)).date(), datetime.min.time())
+                return midnight + timedelta(weeks=num)
             elif 'month' in unit:
                 # Approximate: add 30 days per month
-                return datetime.combine((datetime.now() + timedelta(days=num*30)).date(), datetime.min.time())
+                return midnight + timedelta(days=num*30)
 
         return None
 
-    def _determine_priority(self, text: str) -> str:
+    def _determine_priority(self, text_lower: str, keyword_hits: Optional[KeywordHits] = None) -> str:
         """
-        Determine task priority based on urgency keywords.
+        Determine task priority of lowercased text based on urgency keywords.
         """
-        text_lower = text.lower()
-
-        high_priority_keywords = [
-            'urgent', 'asap', 'immediately', 'now', 'today', 'deadline',
-            'important', 'critical', 'emergency', 'crucial', 'priority'
-        ]
+        if keyword_hits is None:
+            keyword_hits = match_keywords(text_lower)
 
-        low_priority_keywords = [
-            'later', 'whenever', 'eventually', 'maybe', 'someday',
-            'when convenient', 'at leisure'
-        ]
-
-        high_count = sum(1 for keyword in high_priority_keywords if keyword in text_lower)
-        low_count = sum(1 for keyword in low_priority_keywords if keyword in text_lower)
+        high_count = keyword_hits.get(('priority', 'high'), 0)
+        low_count = keyword_hits.get(('priority', 'low'), 0)
 
         if high_count > low_count:
             return "high"
@@ -271,63 +564,41 @@ class TaskParserAgent:
         """
         # Remove time/duration indicators and return the main action
         # This is a simplified version - in practice, you'd want more sophisticated NLP
-        cleaned = re.sub(r'\b(at|on|by|in)\s+\d+(:\d+)?\s*(am|pm|hours?|days?|weeks?)?\b', '', text, flags=re.IGNORECASE)
-        cleaned = re.sub(r'\b(tomorrow|today|tonight|yesterday)\b', '', cleaned, flags=re.IGNORECASE)
+        cleaned = TITLE_STRIP_PATTERN.sub('', text)
 
         # Find the main verb phrase
         # This is a very basic approach - real implementation would use NLP
-        sentences = cleaned.split('.')
-        main_sentence = sentences[0].strip()
+        main_sentence = cleaned.partition('.')[0].strip()
 
-        # Extract the imperative part
-        words = main_sentence.split()
+        # Extract the imperative part; only the first five words are scanned
+        words = list(islice(TITLE_WORD_PATTERN.finditer(main_sentence), 5))
         if len(words) > 3:
             # Take the first 3-5 words as title
-            return ' '.join(words[:min(5, len(words))]).strip()
+            return ' '.join(match.group() for match in words)
         else:
             return main_sentence
 
-    def _generate_tags(self, text: str) -> List[str]:
+    def _generate_tags(self, text_lower: str, keyword_hits: Optional[KeywordHits] = None) -> List[str]:
         """
-        Generate relevant tags based on keywords in the text.
+        Generate relevant tags based on keywords in the lowercased text.
         """
-        text_lower = text.lower()
-        tags = set()
-
-        # Work-related tags
-        if any(word in text_lower for word in ['meeting', 'email', 'project', 'report', 'presentation', 'work', 'office']):
-            tags.add('work')
-
-        # Communication tags
-        if any(word in text_lower for word in ['call', 'email', 'message', 'contact', 'phone', 'text']):
-            tags.add('communication')
-
-        # Errand/shopping tags
-        if any(word in text_lower for word in ['buy', 'shop', 'grocery', 'store', 'purchase', 'errand']):
-            tags.add('errands')
-
-        # Health/wellness tags
-        if any(word in text_lower for word in ['doctor', 'appointment', 'exercise', 'workout', 'health', 'medical']):
-            tags.add('health')
+        if keyword_hits is None:
+            keyword_hits = match_keywords(text_lower)
 
-        # Personal tags
-        if any(word in text_lower for word in ['personal', 'home', 'family', 'friend']):
-            tags.add('personal')
+        tags = [tag for tag in TAG_KEYWORDS if ('tag', tag) in keyword_hits]
 
         # Add a default tag if none were identified
         if not tags:
-            tags.add('general')
+            tags.append('general')
 
-        return list(tags)[:5]  # Limit to 5 tags
+        return tags[:5]  # Limit to 5 tags
 
-    def _estimate_duration(self, text: str) -> Optional[int]:
+    def _estimate_duration(self, text_lower: str, keyword_hits: Optional[KeywordHits] = None) -> Optional[int]:
         """
-        Estimate task duration based on keywords.
+        Estimate task duration of lowercased text based on keywords.
         """
-        text_lower = text.lower()
-
         # Look for explicit duration indicators
-        duration_match = re.search(r'(\d+)\s*(hour|hours|min|minutes?)', text_lower)
+        duration_match = DURATION_PATTERN.search(text_lower)
         if duration_match:
             num = int(duration_match.group(1))
             unit = duration_match.group(2)
@@ -337,19 +608,24 @@ class TaskParserAgent:
                 return num  # Already in minutes
 
         # Estimate based on task type
-        if any(word in text_lower for word in ['meeting', 'call', 'interview']):
-            return 60  # 1 hour
-        elif any(word in text_lower for word in ['email', 'message', 'reply']):
-            return 15  # 15 minutes
-        elif any(word in text_lower for word in ['report', 'analysis', 'research']):
-            return 120  # 2 hours
-        elif any(word in text_lower for word in ['shopping', 'errand']):
-            return 90  # 1.5 hours
-        elif any(word in text_lower for word in ['exercise', 'workout']):
-            return 60  # 1 hour
+        if keyword_hits is None:
+            keyword_hits = match_keywords(text_lower)
+        for index, (minutes, _) in enumerate(DURATION_KEYWORDS):
+            if ('duration', index) in keyword_hits:
+                return minutes
 
         return None  # Unknown duration
 
 
-# Singleton instance
-task_parser_agent = TaskParserAgent()
\ No newline at end of file
+@lru_cache
+def get_task_parser_agent() -> TaskParserAgent:
+    """
+    Get the shared task parser agent, creating it on first use.
+
+    Importing this module does not configure Gemini or build a model;
+    that happens the first time a parser is actually needed.
+
+    Returns:
+        TaskParserAgent instance
+    """
+    return TaskParserAgent()
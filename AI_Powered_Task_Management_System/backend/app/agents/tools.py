@@ -1,8 +1,17 @@
 from datetime import datetime
+from pydantic import TypeAdapter
+from app.models.task import Task
 from app.services.task_service import TaskService
 from app.schemas.task import TaskCreate, TaskUpdate, TaskStatus, Priority
 from typing import List, Optional, Dict, Any
 
+# Dumps a whole task list in one serializer call instead of model_dump per task
+_TASK_LIST_ADAPTER = TypeAdapter(List[Task])
+
+# Plain dict lookup for the model's priority strings; unknown values fall
+# back to medium
+_PRIORITY = {p.value: p for p in Priority}
+
 class AgentTools:
     def __init__(self, service: TaskService, user_id: int):
         self.service = service
@@ -17,7 +26,7 @@ class AgentTools:
         """
         status_enum = TaskStatus(status) if status else None
         tasks = self.service.list_tasks(user_id=self.user_id, status_filter=status_enum, limit=limit)
-        return [t.model_dump() for t in tasks]
+        return _TASK_LIST_ADAPTER.dump_python(tasks)
 
     def create_task(self, title: str, description: str = None, priority: str = "medium", due_date: str = None) -> Dict[str, Any]:
         """
@@ -28,7 +37,7 @@ class AgentTools:
             priority: 'low', 'medium', 'high'
             due_date: ISO 8601 date string
         """
-        priority_enum = Priority(priority) if priority else Priority.MEDIUM
+        priority_enum = _PRIORITY.get(priority, Priority.MEDIUM)
         task_in = TaskCreate(
             title=title,
             description=description,
@@ -51,4 +60,4 @@ class AgentTools:
     def search_tasks(self, query: str) -> List[Dict[str, Any]]:
         """Search tasks by keyword."""
         tasks = self.service.search_tasks(self.user_id, query)
-        return [t.model_dump() for t in tasks]
\ No newline at end of file
+        return _TASK_LIST_ADAPTER.dump_python(tasks)
\ No newline at end of file
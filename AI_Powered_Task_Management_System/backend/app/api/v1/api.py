@@ -5,12 +5,13 @@ Combines all v1 endpoint routers into a single router for inclusion in the main
 """
 
 from fastapi import APIRouter
-from app.api.v1.endpoints import tasks, chat
+from app.api.v1.endpoints import tasks, chat, jobs
 
 api_router = APIRouter()
 
 # Include endpoint routers
 api_router.include_router(tasks.router)
 api_router.include_router(chat.router)
+api_router.include_router(jobs.router)
 # api_router.include_router(analytics.router)
 # api_router.include_router(tags.router)
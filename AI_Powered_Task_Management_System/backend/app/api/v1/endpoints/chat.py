@@ -1,9 +1,13 @@
-from fastapi import APIRouter, Depends, Body
+from typing import Callable
+from fastapi import APIRouter, BackgroundTasks, Depends, Body
 from app.services.task_service import TaskService, get_task_service
 from app.services.conversation_service import ConversationService
-from app.core.database import get_session
+from app.core.database import get_session, get_session_factory
 from app.agents.tools import AgentTools
 from app.agents.database_agent import DatabaseAgent
+from app.agents.chat_agent import MUTATION_INTENT_PATTERN
+from app.agents.task_parser import canonical_input
+from app.core.cache import get_llm_cache, make_cache_key
 from app.schemas.response import APIResponse
 from sqlmodel import Session
 
@@ -11,11 +15,24 @@ router = APIRouter(prefix="/chat", tags=["Chat"])
 
 DEFAULT_USER_ID = 1
 
+
+def _save_exchange(
+    session_factory: Callable[[], Session], user_id: int, message: str, response: str
+) -> None:
+    """Persist one user message and the agent's reply."""
+    # Runs after the response is sent, when the request's session is closed
+    with session_factory() as session:
+        ConversationService(session).save_messages(
+            user_id, [("user", message), ("assistant", response)]
+        )
+
 @router.post("", response_model=APIResponse[str])
 async def chat_with_agent(
+    background_tasks: BackgroundTasks,
     message: str = Body(..., embed=True),
     task_service: TaskService = Depends(get_task_service),
-    db_session: Session = Depends(get_session)
+    db_session: Session = Depends(get_session),
+    session_factory: Callable[[], Session] = Depends(get_session_factory)
 ):
     """
     Chat with the Database Agent with multi-turn memory.
@@ -25,14 +42,36 @@ async def chat_with_agent(
     # 1. Fetch recent history
     history = conv_service.get_history(DEFAULT_USER_ID, limit=10)
     
+    # Read-only questions worded the same way ("Show my tasks!" / "show my
+    # tasks") in the same conversation get the cached reply while the
+    # user's tasks are unchanged; requests that change tasks always run the
+    # agent. The history is part of the key because the agent sees it, so
+    # a follow-up like "what about the second one?" depends on it.
+    llm_cache = get_llm_cache()
+    cache_key = None
+    if not MUTATION_INTENT_PATTERN.search(message):
+        cache_key = make_cache_key(
+            "database-agent",
+            DEFAULT_USER_ID,
+            canonical_input(message),
+            [(row.role, row.content) for row in history],
+            task_service.get_data_version(DEFAULT_USER_ID),
+        )
+    response = await llm_cache.get(cache_key) if cache_key else None
+
     # 2. Run Agent
-    tools = AgentTools(task_service, DEFAULT_USER_ID)
-    agent = DatabaseAgent(tools)
-    response = await agent.run(message, history=list(history))
+    if response is None:
+        tools = AgentTools(task_service, DEFAULT_USER_ID)
+        agent = DatabaseAgent(tools)
+        response = await agent.run(message, history=list(history))
+        if cache_key and agent.answered:
+            await llm_cache.set(cache_key, response)
     
-    # 3. Save conversation to DB
-    conv_service.save_message(DEFAULT_USER_ID, "user", message)
-    conv_service.save_message(DEFAULT_USER_ID, "assistant", response)
+    # 3. Save conversation to DB once the reply has been sent, keeping the
+    # writes off the response path
+    background_tasks.add_task(
+        _save_exchange, session_factory, DEFAULT_USER_ID, message, response
+    )
     
     return APIResponse(
         success=True,
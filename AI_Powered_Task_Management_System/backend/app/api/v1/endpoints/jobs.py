@@ -0,0 +1,64 @@
+"""
+Background job API endpoints.
+
+Report the state and result of jobs started by AI endpoints, either as a
+single lookup or as a Server-Sent Events stream that ends with the result.
+"""
+
+import asyncio
+
+import orjson
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import StreamingResponse
+
+from app.core.jobs import Job, get_job_store
+from app.schemas.response import APIResponse
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+# Seconds between keep-alive comments while a streamed job is pending
+STREAM_KEEPALIVE_SECONDS = 15
+
+
+def _get_job_or_404(job_id: str) -> Job:
+    job = get_job_store().get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job {job_id} not found"
+        )
+    return job
+
+
+@router.get("/{job_id}", response_model=APIResponse[dict])
+def get_job(job_id: str):
+    """
+    Get the status of a background job, with its result once finished.
+    """
+    job = _get_job_or_404(job_id)
+    return APIResponse(success=True, data=job.to_dict())
+
+
+@router.get("/{job_id}/stream")
+async def stream_job(job_id: str):
+    """
+    Stream a background job's completion as Server-Sent Events.
+
+    Sends a keep-alive comment while the job is pending and a single
+    `completed` or `failed` event carrying the job, then closes.
+    """
+    job = _get_job_or_404(job_id)
+
+    async def events():
+        while not job.done.is_set():
+            try:
+                await asyncio.wait_for(job.done.wait(), timeout=STREAM_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield b": keep-alive\n\n"
+        yield b"event: " + job.status.encode() + b"\ndata: " + orjson.dumps(job.to_dict()) + b"\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
@@ -5,11 +5,13 @@ Provides CRUD operations and AI-enhanced functionality for tasks
 using service layer and intelligent agents.
 """
 
-from typing import List, Optional, Annotated
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Annotated
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
 from sqlmodel import Session
 
-from app.core.database import get_session
+from app.core.database import get_session, get_session_factory
+from app.core.jobs import get_job_store
 from app.models.task import Task, TaskStatus, Priority
 from app.schemas.task import (
     TaskCreate,
@@ -20,22 +22,27 @@ from app.schemas.task import (
 )
 from app.schemas.response import APIResponse
 from app.services.task_service import TaskService, get_task_service
-from app.agents.task_parser import task_parser_agent
-from app.agents.task_intelligence_agent import task_intelligence_agent
+from app.agents.task_parser import get_task_parser_agent
+from app.agents.task_intelligence_agent import get_task_intelligence_agent
 from app.agents.context_manager import get_context_manager
 
+# Database sessions are synchronous. Endpoints that only use the database
+# are plain functions, which FastAPI runs in its threadpool so a query
+# never blocks the event loop; only endpoints awaiting Gemini are async,
+# and they hand their queries to the threadpool with run_in_threadpool.
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
 
 # Dependency annotations
 SessionDep = Annotated[Session, Depends(get_session)]
 TaskServiceDep = Annotated[TaskService, Depends(get_task_service)]
+SessionFactoryDep = Annotated[Callable[[], Session], Depends(get_session_factory)]
 
 # Default user ID for single-user mode
 DEFAULT_USER_ID = 1
 
 
 @router.post("", response_model=APIResponse[TaskResponse], status_code=status.HTTP_201_CREATED)
-async def create_task(
+def create_task(
     task_in: TaskCreate,
     service: TaskServiceDep
 ):
@@ -90,33 +97,86 @@ async def create_task_from_natural_language(
     - Priority: Based on urgency keywords
     - Tags: ["communication", "project", "budget"]
     """
+    task = await _create_task_from_text(nl_input, service)
+
+    return APIResponse(
+        success=True,
+        data=task,
+        message="Task created successfully from natural language"
+    )
+
+
+@router.post("/nl-create/jobs", response_model=APIResponse[dict], status_code=status.HTTP_202_ACCEPTED)
+async def create_task_from_natural_language_job(
+    nl_input: NaturalLanguageTaskCreate,
+    session_factory: SessionFactoryDep
+):
+    """
+    Create a task from natural language input in the background.
+
+    Same as `POST /tasks/nl-create`, but answers at once with a job ID
+    instead of waiting for Gemini. The created task is the job's result at
+    `GET /jobs/{job_id}`, or streamed from `GET /jobs/{job_id}/stream`.
+    """
+    job = get_job_store().submit(_run_task_job(
+        session_factory,
+        lambda service: _create_task_from_text(nl_input, service),
+        _task_json
+    ))
+
+    return APIResponse(
+        success=True,
+        data=job.to_dict(),
+        message="Task creation started"
+    )
+
+
+async def _create_task_from_text(nl_input: NaturalLanguageTaskCreate, service: TaskService) -> Task:
+    """Parse natural language input with AI and create the task."""
     # Fetch recent tasks for context
-    context_manager = get_context_manager(service.session, DEFAULT_USER_ID)
-    recent_tasks = service.list_tasks(user_id=DEFAULT_USER_ID, limit=5)
-    task_context = context_manager.get_task_context(recent_tasks)
+    task_context = await run_in_threadpool(_recent_task_context, service)
 
     # Merge with provided context
     full_context = nl_input.context or {}
     full_context.update(task_context)
 
     # Parse natural language using AI agent
-    parsed_task = await task_parser_agent.parse_natural_language_task(
+    parsed_task = await get_task_parser_agent().parse_natural_language_task(
         nl_input.message,
         user_context=full_context
     )
 
     # Create task using service
-    task = service.create_task(parsed_task, user_id=DEFAULT_USER_ID)
+    return await run_in_threadpool(service.create_task, parsed_task, user_id=DEFAULT_USER_ID)
 
-    return APIResponse(
-        success=True,
-        data=task,
-        message="Task created successfully from natural language"
-    )
+
+def _recent_task_context(service: TaskService) -> Dict[str, Any]:
+    """Summarize the user's recent tasks as context for the parser."""
+    context_manager = get_context_manager(service.session, DEFAULT_USER_ID)
+    recent_tasks = service.list_tasks(user_id=DEFAULT_USER_ID, limit=5)
+    return context_manager.get_task_context(recent_tasks)
+
+
+def _task_json(task: Task) -> dict:
+    """Serialize a task the way TaskResponse does, for job results."""
+    return TaskResponse.model_validate(task).model_dump(mode="json")
+
+
+async def _run_task_job(
+    session_factory: Callable[[], Session],
+    work: Callable[[TaskService], Awaitable[Any]],
+    serialize: Callable[[Any], Any] = lambda result: result
+) -> Any:
+    """Run an AI endpoint's work as a job, with its own session."""
+    # The request's session is closed once the 202 response is sent
+    with session_factory() as session:
+        result = await work(TaskService(session))
+        # Serializing may load relationships, so it is a query as well
+        return await run_in_threadpool(serialize, result)
 
 
 @router.get("", response_model=APIResponse[TaskListResponse])
-async def list_tasks(
+def list_tasks(
     service: TaskServiceDep,
     session: SessionDep,
     status_filter: Optional[TaskStatus] = Query(None, alias="status", description="Filter by status"),
@@ -137,7 +197,8 @@ async def list_tasks(
     - `limit`: Max results per page (default: 50, max: 100)
     - `include_subtasks`: Include subtasks (default: true)
     """
-    tasks = service.list_tasks(
+    # The page and the total for pagination come from one query
+    tasks, total = service.list_tasks_page(
         user_id=DEFAULT_USER_ID,
         skip=skip,
         limit=limit,
@@ -146,10 +207,6 @@ async def list_tasks(
         include_subtasks=include_subtasks
     )
 
-    # Get total count for pagination
-    stats = service.get_task_statistics(DEFAULT_USER_ID)
-    total = stats["total"]
-
     return APIResponse(
         success=True,
         data=TaskListResponse(
@@ -163,7 +220,7 @@ async def list_tasks(
 
 
 @router.get("/search", response_model=APIResponse[List[TaskResponse]])
-async def search_tasks(
+def search_tasks(
     service: TaskServiceDep,
     q: str = Query(..., min_length=2, description="Search query"),
     skip: int = Query(0, ge=0),
@@ -189,7 +246,7 @@ async def search_tasks(
 
 
 @router.get("/overdue", response_model=APIResponse[List[TaskResponse]])
-async def get_overdue_tasks(
+def get_overdue_tasks(
     service: TaskServiceDep,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=100)
@@ -209,7 +266,7 @@ async def get_overdue_tasks(
 
 
 @router.get("/upcoming", response_model=APIResponse[List[TaskResponse]])
-async def get_upcoming_tasks(
+def get_upcoming_tasks(
     service: TaskServiceDep,
     days: int = Query(7, ge=1, le=30, description="Days to look ahead"),
     skip: int = Query(0, ge=0),
@@ -231,7 +288,7 @@ async def get_upcoming_tasks(
 
 
 @router.get("/statistics", response_model=APIResponse[dict])
-async def get_task_statistics(
+def get_task_statistics(
     service: TaskServiceDep
 ):
     """
@@ -279,9 +336,7 @@ async def get_productivity_insights(
     }
     ```
     """
-    stats = service.get_task_statistics(user_id=DEFAULT_USER_ID)
-
-    insights = await task_intelligence_agent.get_productivity_insights(stats)
+    insights = await _productivity_insights(service)
 
     return APIResponse(
         success=True,
@@ -290,6 +345,29 @@ async def get_productivity_insights(
     )
 
 
+@router.post("/insights/productivity/jobs", response_model=APIResponse[dict], status_code=status.HTTP_202_ACCEPTED)
+async def get_productivity_insights_job(session_factory: SessionFactoryDep):
+    """
+    Generate productivity insights in the background.
+
+    Same as `GET /tasks/insights/productivity`, but answers at once with a
+    job ID; the insights are the job's result.
+    """
+    job = get_job_store().submit(_run_task_job(session_factory, _productivity_insights))
+
+    return APIResponse(
+        success=True,
+        data=job.to_dict(),
+        message="Insights generation started"
+    )
+
+
+async def _productivity_insights(service: TaskService) -> dict:
+    """Generate AI productivity insights from the user's task statistics."""
+    stats = await run_in_threadpool(service.get_task_statistics, user_id=DEFAULT_USER_ID)
+    return await get_task_intelligence_agent().get_productivity_insights(stats)
+
+
 @router.post("/{task_id}/schedule", response_model=APIResponse[dict])
 async def schedule_task(
     task_id: int,
@@ -298,12 +376,12 @@ async def schedule_task(
     """
     Get AI suggestion for when to schedule this task.
     """
-    task = service.get_task(task_id, user_id=DEFAULT_USER_ID)
+    task = await run_in_threadpool(service.get_task, task_id, user_id=DEFAULT_USER_ID)
     
     # In a real app, we'd fetch user's calendar/availability here
     user_context = {"work_hours": "09:00-17:00", "timezone": "UTC"}
     
-    schedule = await task_intelligence_agent.suggest_schedule(task, user_context)
+    schedule = await get_task_intelligence_agent().suggest_schedule(task, user_context)
     
     return APIResponse(
         success=True,
@@ -313,7 +391,7 @@ async def schedule_task(
 
 
 @router.get("/{task_id}", response_model=APIResponse[TaskResponse])
-async def get_task(
+def get_task(
     task_id: int,
     service: TaskServiceDep
 ):
@@ -331,7 +409,7 @@ async def get_task(
 
 
 @router.put("/{task_id}", response_model=APIResponse[TaskResponse])
-async def update_task(
+def update_task(
     task_id: int,
     task_update: TaskUpdate,
     service: TaskServiceDep
@@ -359,7 +437,7 @@ async def update_task(
 
 
 @router.delete("/{task_id}", response_model=APIResponse[dict])
-async def delete_task(
+def delete_task(
     task_id: int,
     service: TaskServiceDep,
     cascade_subtasks: bool = Query(False, description="Delete subtasks as well")
@@ -380,7 +458,7 @@ async def delete_task(
 
 
 @router.post("/{task_id}/complete", response_model=APIResponse[TaskResponse])
-async def complete_task(
+def complete_task(
     task_id: int,
     service: TaskServiceDep,
     actual_duration: Optional[int] = Query(None, description="Actual time spent in minutes")
@@ -410,12 +488,52 @@ async def breakdown_task(
     Break down a complex task into subtasks.
     If titles are provided, uses those. Otherwise, uses AI to generate them.
     """
+    subtasks = await _breakdown_task(task_id, service, titles)
+
+    return APIResponse(
+        success=True,
+        data=subtasks,
+        message=f"Created {len(subtasks)} subtasks"
+    )
+
+
+@router.post("/{task_id}/breakdown/jobs", response_model=APIResponse[dict], status_code=status.HTTP_202_ACCEPTED)
+async def breakdown_task_job(
+    task_id: int,
+    session_factory: SessionFactoryDep,
+    titles: Optional[List[str]] = None
+):
+    """
+    Break down a task into subtasks in the background.
+
+    Same as `POST /tasks/{task_id}/breakdown`, but answers at once with a
+    job ID; the created subtasks are the job's result.
+    """
+    job = get_job_store().submit(_run_task_job(
+        session_factory,
+        lambda service: _breakdown_task(task_id, service, titles),
+        lambda subtasks: [_task_json(subtask) for subtask in subtasks]
+    ))
+
+    return APIResponse(
+        success=True,
+        data=job.to_dict(),
+        message="Task breakdown started"
+    )
+
+
+async def _breakdown_task(
+    task_id: int,
+    service: TaskService,
+    titles: Optional[List[str]] = None
+) -> List[Task]:
+    """Create subtasks from the given titles, or from AI suggestions."""
     # Get the task
-    task = service.get_task(task_id, user_id=DEFAULT_USER_ID)
+    task = await run_in_threadpool(service.get_task, task_id, user_id=DEFAULT_USER_ID)
 
     if not titles:
         # Get AI suggestions for subtasks
-        subtask_titles = await task_intelligence_agent.suggest_task_breakdown(
+        subtask_titles = await get_task_intelligence_agent().suggest_task_breakdown(
             task.title,
             task.description or ""
         )
@@ -423,18 +541,13 @@ async def breakdown_task(
         subtask_titles = titles
 
     # Create subtasks
-    subtasks = service.create_subtasks(
+    return await run_in_threadpool(
+        service.create_subtasks,
         parent_task_id=task_id,
         user_id=DEFAULT_USER_ID,
         subtask_titles=subtask_titles
     )
 
-    return APIResponse(
-        success=True,
-        data=subtasks,
-        message=f"Created {len(subtasks)} subtasks"
-    )
-
 
 @router.get("/{task_id}/breakdown/suggest", response_model=APIResponse[List[str]])
 async def suggest_breakdown(
@@ -444,9 +557,9 @@ async def suggest_breakdown(
     """
     Get AI suggestions for breaking down a task without creating them.
     """
-    task = service.get_task(task_id, user_id=DEFAULT_USER_ID)
+    task = await run_in_threadpool(service.get_task, task_id, user_id=DEFAULT_USER_ID)
     
-    subtask_titles = await task_intelligence_agent.suggest_task_breakdown(
+    subtask_titles = await get_task_intelligence_agent().suggest_task_breakdown(
         task.title,
         task.description or ""
     )
@@ -481,12 +594,36 @@ async def get_task_insights(
     }
     ```
     """
-    task = service.get_task(task_id, user_id=DEFAULT_USER_ID)
-
-    insights = await task_intelligence_agent.analyze_task(task)
+    insights = await _task_insights(task_id, service)
 
     return APIResponse(
         success=True,
         data=insights,
         message="Insights generated successfully"
-    )
\ No newline at end of file
+    )
+
+
+@router.post("/{task_id}/insights/jobs", response_model=APIResponse[dict], status_code=status.HTTP_202_ACCEPTED)
+async def get_task_insights_job(task_id: int, session_factory: SessionFactoryDep):
+    """
+    Generate insights for a specific task in the background.
+
+    Same as `GET /tasks/{task_id}/insights`, but answers at once with a job
+    ID; the insights are the job's result.
+    """
+    job = get_job_store().submit(_run_task_job(
+        session_factory,
+        lambda service: _task_insights(task_id, service)
+    ))
+
+    return APIResponse(
+        success=True,
+        data=job.to_dict(),
+        message="Insights generation started"
+    )
+
+
+async def _task_insights(task_id: int, service: TaskService) -> dict:
+    """Analyze one task with AI."""
+    task = await run_in_threadpool(service.get_task, task_id, user_id=DEFAULT_USER_ID)
+    return await get_task_intelligence_agent().analyze_task(task)
\ No newline at end of file
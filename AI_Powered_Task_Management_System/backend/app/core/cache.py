@@ -0,0 +1,194 @@
+"""
+In-process caching utilities.
+
+Provides a small thread-safe LRU cache with per-entry expiry, a helper
+for building stable cache keys from JSON-serializable values, and an async
+cache for LLM results that can be backed by process memory or Redis.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Hashable, Optional, Protocol
+
+from app.core.config import settings
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a time-to-live.
+
+    Safe to share between async handlers and threadpool workers; no lock is
+    ever held across an await.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries before the least recently
+                used one is evicted
+            ttl: Default time-to-live in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the cached value for key, or default if missing or expired.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store value under key.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Optional per-entry time-to-live overriding the default
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Remove key from the cache if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def make_cache_key(*parts: Any) -> str:
+    """
+    Build a stable cache key from JSON-serializable parts.
+
+    Values are serialized with sorted keys so logically equal inputs map
+    to the same key, then hashed to keep keys short.
+
+    Example:
+        key = make_cache_key(message, task_context, history)
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class CacheBackend(Protocol):
+    """Storage used by LLMCache."""
+
+    async def get(self, key: str) -> Optional[Any]:
+        ...
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        ...
+
+
+class MemoryCacheBackend:
+    """Per-process LLMCache backend built on TTLCache."""
+
+    def __init__(self, maxsize: int):
+        self._cache = TTLCache(maxsize=maxsize)
+
+    async def get(self, key: str) -> Optional[Any]:
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        self._cache.set(key, value, ttl=ttl)
+
+
+class RedisCacheBackend:
+    """
+    LLMCache backend shared by all workers through Redis.
+
+    Values are stored as JSON. Requires the optional `redis` package.
+    """
+
+    def __init__(self, url: str, prefix: str = "llm:"):
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError as e:
+            raise RuntimeError(
+                "LLM_CACHE_BACKEND=redis requires the 'redis' package"
+            ) from e
+        self._client = redis_asyncio.from_url(url)
+        self._prefix = prefix
+
+    async def get(self, key: str) -> Optional[Any]:
+        raw = await self._client.get(self._prefix + key)
+        return None if raw is None else json.loads(raw)
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        await self._client.set(
+            self._prefix + key,
+            json.dumps(value, default=str),
+            ex=max(int(ttl), 1),
+        )
+
+
+class LLMCache:
+    """
+    Async cache for model results.
+
+    Backend errors are treated as misses so an unavailable cache never
+    fails the request.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: float):
+        self.backend = backend
+        self.ttl = ttl
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None."""
+        try:
+            return await self.backend.get(key)
+        except Exception as e:
+            print(f"LLM cache read failed: {e}")
+            return None
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store value under key for ttl seconds (default: the cache TTL)."""
+        try:
+            await self.backend.set(key, value, self.ttl if ttl is None else ttl)
+        except Exception as e:
+            print(f"LLM cache write failed: {e}")
+
+
+@lru_cache
+def get_llm_cache() -> LLMCache:
+    """
+    Return the process-wide LLM cache configured by LLM_CACHE_BACKEND.
+
+    Returns:
+        LLMCache using Redis when LLM_CACHE_BACKEND is "redis", otherwise
+        an in-memory LRU
+    """
+    if settings.LLM_CACHE_BACKEND == "redis":
+        backend: CacheBackend = RedisCacheBackend(settings.REDIS_URL)
+    else:
+        backend = MemoryCacheBackend(maxsize=settings.LLM_CACHE_MAX_SIZE)
+    return LLMCache(backend, ttl=settings.LLM_CACHE_TTL)
@@ -5,7 +5,8 @@ This module handles all application settings using Pydantic Settings,
 enabling configuration through environment variables and .env files.
 """
 
-from typing import List, Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -33,6 +34,10 @@ class Settings(BaseSettings):
 
     # Database Configuration
     DATABASE_URL: str = "sqlite:///./taskmanager.db"
+    SQL_ECHO: bool = False  # Log every SQL statement (costly; debugging only)
+    DB_POOL_SIZE: int = 20  # Server databases only; SQLite uses its own pool
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_RECYCLE: int = 1800  # seconds
 
     # Security Settings
     JWT_SECRET_KEY: str = Field(..., min_length=32)
@@ -44,9 +49,9 @@ class Settings(BaseSettings):
 
     @field_validator("ALLOWED_ORIGINS")
     @classmethod
-    def parse_origins(cls, v: str) -> List[str]:
-        """Parse comma-separated CORS origins."""
-        return [origin.strip() for origin in v.split(",")]
+    def parse_origins(cls, v: str) -> Tuple[str, ...]:
+        """Parse comma-separated CORS origins once, at validation time."""
+        return tuple(origin.strip() for origin in v.split(","))
 
     # AI/LLM Configuration
     GEMINI_API_KEY: str = Field(..., description="Google Gemini API key")
@@ -64,6 +69,18 @@ class Settings(BaseSettings):
     AI_TEMPERATURE: float = 0.7
     AI_MAX_TOKENS: int = 1000
 
+    # LLM Response Caching
+    LLM_CACHE_TTL: int = 300  # seconds
+    LLM_CACHE_MAX_SIZE: int = 256
+    LLM_CACHE_BACKEND: str = "memory"  # "memory" or "redis"
+    REDIS_URL: str = "redis://localhost:6379/0"
+
+    # Gemini context caching of static prompt prefixes (requires an SDK and
+    # model with CachedContent support; the prefix must meet the model's
+    # minimum cacheable token count)
+    GEMINI_CONTEXT_CACHE_ENABLED: bool = False
+    GEMINI_CONTEXT_CACHE_TTL: int = 3600  # seconds
+
     # Rate Limiting (for future use)
     RATE_LIMIT_REQUESTS: int = 100
     RATE_LIMIT_PERIOD: int = 60  # seconds
@@ -80,5 +97,19 @@ class Settings(BaseSettings):
         return self.DATABASE_URL
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the process-wide settings.
+
+    The environment and .env file are read and validated on first call
+    only; use this (or `Depends(get_settings)`) rather than `Settings()`.
+
+    Returns:
+        Settings instance
+    """
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
@@ -5,19 +5,47 @@ This module configures SQLModel/SQLAlchemy engine and provides
 session management for dependency injection.
 """
 
-from typing import Generator
+from typing import Any, Callable, Dict, Generator
+from sqlalchemy import event, text
 from sqlmodel import Session, create_engine, SQLModel
 from app.core.config import settings
 
 
+def _engine_options(database_url: str) -> Dict[str, Any]:
+    """
+    Engine keyword arguments for the configured database.
+
+    SQLite connections are local files, so only lock waits are tuned;
+    server databases get a sized, health-checked connection pool.
+    """
+    if database_url.startswith("sqlite"):
+        return {"connect_args": {"check_same_thread": False, "timeout": 30}}
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_pre_ping": True,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+
+
 # Create database engine
 engine = create_engine(
     settings.DATABASE_URL,
-    echo=settings.DEBUG,  # Log SQL queries in debug mode
-    connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {}
+    echo=settings.SQL_ECHO,  # Statement logging is opt-in, not tied to DEBUG
+    **_engine_options(settings.DATABASE_URL)
 )
 
 
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        """Let readers run alongside a writer and sync less often (WAL)."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+
 def init_db() -> None:
     """
     Initialize database by creating all tables.
@@ -25,8 +53,19 @@ def init_db() -> None:
     This function creates all tables defined by SQLModel models.
     Should be called on application startup.
     """
+    if engine.dialect.name == "postgresql":
+        # Trigram operator classes used by the task search indexes
+        with engine.begin() as connection:
+            connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
     SQLModel.metadata.create_all(engine)
 
+    # create_all skips tables that already exist, so indexes added to a
+    # model later are created here for existing databases
+    for table in SQLModel.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
+
 
 def get_session() -> Generator[Session, None, None]:
     """
@@ -43,5 +82,21 @@ def get_session() -> Generator[Session, None, None]:
             return tasks
         ```
     """
-    with Session(engine) as session:
+    # Objects keep their loaded state after commit, so returning a just-saved
+    # task does not reload it (nothing is computed by the database on write)
+    with Session(engine, expire_on_commit=False) as session:
         yield session
+
+
+def get_session_factory() -> Callable[[], Session]:
+    """
+    Dependency function for FastAPI to provide a session factory.
+
+    For work that outlives the request (background tasks and jobs), which
+    cannot use the request's session because it is closed once the response
+    is sent. Each call opens a new session configured like get_session's.
+
+    Returns:
+        Callable[[], Session]: Function returning a new database session
+    """
+    return lambda: Session(engine, expire_on_commit=False)
@@ -0,0 +1,187 @@
+"""
+Shared Google Gemini client configuration.
+
+`genai.configure()` discards every client the SDK has already created, so
+calling it from each agent (or per request) throws away pooled gRPC
+channels and forces a new connection and TLS handshake. Agents call
+`configure_gemini()` instead, which configures the SDK exactly once.
+
+`get_model()` returns a shared `GenerativeModel` per model name and
+generation config, so agents built per request do not construct new ones.
+All models send requests through the SDK's one default async client, whose
+channel `close_gemini()` shuts down when the application stops.
+
+Static prompt prefixes can also be registered with Gemini context caching
+through `get_cached_content()`, so the server does not reprocess them on
+every request.
+"""
+
+import dataclasses
+import threading
+import time
+from datetime import timedelta
+from typing import Any, Dict, Optional, Tuple
+
+import google.generativeai as genai
+from google.generativeai import client as genai_client
+
+from app.core.config import settings
+
+
+# Whether the installed SDK accepts `response_schema` in generation_config
+# (constrained JSON decoding); older releases reject unknown config keys
+SUPPORTS_RESPONSE_SCHEMA = "response_schema" in {
+    field.name for field in dataclasses.fields(genai.types.GenerationConfig)
+}
+
+_configured = False
+_configure_lock = threading.Lock()
+
+# (model name, generation config items) -> GenerativeModel
+_models: Dict[Tuple[Any, ...], genai.GenerativeModel] = {}
+_models_lock = threading.Lock()
+
+
+def configure_gemini() -> None:
+    """
+    Configure the Gemini SDK once per process.
+
+    Safe to call repeatedly; only the first call has any effect, so the
+    SDK's cached clients (and their connections) are reused.
+    """
+    global _configured
+    if _configured:
+        return
+    with _configure_lock:
+        if not _configured:
+            genai.configure(api_key=settings.GEMINI_API_KEY)
+            _configured = True
+
+
+async def close_gemini() -> None:
+    """
+    Close the SDK's shared async client, if a request has opened one.
+
+    Called at application shutdown so the pooled gRPC channel is closed
+    cleanly instead of being dropped with the event loop.
+    """
+    clients = getattr(getattr(genai_client, "_client_manager", None), "clients", None)
+    if not clients:
+        return
+    async_client = clients.pop("generative_async", None)
+    if async_client is None:
+        return
+    try:
+        await async_client.transport.close()
+    except Exception as e:
+        print(f"Failed to close Gemini client: {e}")
+
+
+def get_model(
+    model_name: str,
+    generation_config: Dict[str, Any],
+    cached_content: Optional[Any] = None,
+) -> genai.GenerativeModel:
+    """
+    Return a shared GenerativeModel for the given settings.
+
+    Models hold no per-request state, so one instance per distinct
+    configuration is reused for the life of the process.
+
+    Args:
+        model_name: Gemini model name
+        generation_config: Default generation parameters (hashable values)
+        cached_content: Optional CachedContent the model should be bound to
+
+    Returns:
+        GenerativeModel instance
+    """
+    cached_name = getattr(cached_content, "name", None)
+    key = (model_name, cached_name, tuple(sorted(generation_config.items())))
+    model = _models.get(key)
+    if model is not None:
+        return model
+
+    configure_gemini()
+    with _models_lock:
+        model = _models.get(key)
+        if model is None:
+            if cached_content is not None:
+                model = genai.GenerativeModel.from_cached_content(
+                    cached_content=cached_content,
+                    generation_config=generation_config,
+                )
+            else:
+                model = genai.GenerativeModel(
+                    model_name=model_name,
+                    generation_config=generation_config,
+                )
+            _models[key] = model
+        return model
+
+
+# name -> (expires_at, CachedContent or None when creation failed)
+_cached_contents: Dict[str, Tuple[float, Any]] = {}
+_cached_contents_lock = threading.Lock()
+
+
+def get_cached_content(name: str, system_instruction: str) -> Optional[Any]:
+    """
+    Return a Gemini CachedContent holding a static system prompt.
+
+    The cache is created once per process and recreated shortly before its
+    TTL runs out. Returns None when context caching is disabled, the
+    installed SDK does not support it, or the API rejects the prompt (for
+    example because it is below the model's minimum cacheable size);
+    callers then send the prompt inline as usual. A failed attempt is not
+    retried until the TTL elapses.
+
+    Args:
+        name: Stable identifier of the prompt, used as the cache display name
+        system_instruction: Static prompt text to cache
+
+    Returns:
+        CachedContent handle or None
+    """
+    if not settings.GEMINI_CONTEXT_CACHE_ENABLED:
+        return None
+    caching = getattr(genai, "caching", None)
+    if caching is None:
+        return None
+
+    ttl = settings.GEMINI_CONTEXT_CACHE_TTL
+    with _cached_contents_lock:
+        entry = _cached_contents.get(name)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        configure_gemini()
+        try:
+            cached = caching.CachedContent.create(
+                model=settings.GEMINI_MODEL_NAME,
+                display_name=name,
+                system_instruction=system_instruction,
+                ttl=timedelta(seconds=ttl),
+            )
+        except Exception as e:
+            print(f"Context caching unavailable for {name}: {e}")
+            cached = None
+
+        # Refresh a minute early so requests never reference an expired cache
+        _cached_contents[name] = (time.monotonic() + max(ttl - 60, 0), cached)
+        return cached
+
+
+def json_schema_config(schema: Any) -> Optional[Dict[str, Any]]:
+    """
+    Build a per-call generation_config constraining output to schema.
+
+    Args:
+        schema: Response type, e.g. a pydantic model or `list[str]`
+
+    Returns:
+        Generation config override, or None when the SDK cannot apply it
+    """
+    if not SUPPORTS_RESPONSE_SCHEMA:
+        return None
+    return {"response_mime_type": "application/json", "response_schema": schema}
@@ -0,0 +1,102 @@
+"""
+In-process background jobs for slow AI operations.
+
+Endpoints that wait on Gemini can hand the work to `JobStore.submit()` and
+answer immediately with a job ID. Clients then poll `GET /jobs/{id}` or
+follow `GET /jobs/{id}/stream` (Server-Sent Events) for the result, so no
+request is held open for the length of a model call.
+
+Jobs run as asyncio tasks in the API process and results are kept in
+memory for `JOB_RESULT_TTL` seconds; they do not survive a restart and are
+only visible to the worker process that ran them.
+"""
+
+import asyncio
+import uuid
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Awaitable, Dict, Optional
+
+
+# Seconds a finished job's result stays available
+JOB_RESULT_TTL = 600
+
+
+@dataclass
+class Job:
+    """State of one background job."""
+
+    id: str
+    status: str = "pending"  # "pending", "completed" or "failed"
+    result: Any = None
+    error: Optional[str] = None
+    done: asyncio.Event = field(default_factory=asyncio.Event, repr=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Public view of the job for API responses."""
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+class JobStore:
+    """
+    Registry of background jobs running on the current event loop.
+    """
+
+    def __init__(self, ttl: float = JOB_RESULT_TTL):
+        """
+        Initialize the store.
+
+        Args:
+            ttl: Seconds a finished job is kept before it is forgotten
+        """
+        self.ttl = ttl
+        self._jobs: Dict[str, Job] = {}
+        # Strong references, so running tasks are not garbage collected
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def submit(self, work: Awaitable[Any]) -> Job:
+        """
+        Start work in the background and return its job.
+
+        Args:
+            work: Coroutine producing a JSON-serializable result
+
+        Returns:
+            The pending Job
+        """
+        job = Job(id=uuid.uuid4().hex)
+        self._jobs[job.id] = job
+        self._tasks[job.id] = asyncio.create_task(self._run(job, work))
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Return the job with this ID, or None if unknown or expired."""
+        return self._jobs.get(job_id)
+
+    async def _run(self, job: Job, work: Awaitable[Any]) -> None:
+        try:
+            job.result = await work
+            job.status = "completed"
+        except Exception as e:
+            job.error = str(e)
+            job.status = "failed"
+        finally:
+            job.done.set()
+            self._tasks.pop(job.id, None)
+            asyncio.get_running_loop().call_later(self.ttl, self._jobs.pop, job.id, None)
+
+
+@lru_cache
+def get_job_store() -> JobStore:
+    """
+    Return the process-wide job store.
+
+    Returns:
+        JobStore instance
+    """
+    return JobStore()
@@ -4,15 +4,26 @@ Security utilities for authentication and authorization.
 Provides JWT token creation, validation, and password hashing utilities.
 """
 
+import time
 from datetime import datetime, timedelta
 from typing import Optional
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+import bcrypt
+import jwt
+from app.core.cache import TTLCache
 from app.core.config import settings
 
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt work factor; same as the passlib default used for existing hashes
+BCRYPT_ROUNDS = 12
+
+# bcrypt only uses the first 72 bytes of a password
+BCRYPT_MAX_PASSWORD_BYTES = 72
+
+# Decoded payloads of recently verified tokens. A token cannot change, so
+# it is only decoded again after its entry expires: at the token's own
+# expiry, or after at most this many seconds
+TOKEN_CACHE_TTL = 300
+_verified_tokens = TTLCache(maxsize=10_000, ttl=TOKEN_CACHE_TTL)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -61,12 +72,20 @@ def verify_token(token: str) -> Optional[dict]:
             user_email = payload.get("sub")
         ```
     """
+    payload = _verified_tokens.get(token)
+    if payload is not None:
+        return dict(payload)
+
     try:
         payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
-        return payload
-    except JWTError:
+    except jwt.PyJWTError:
         return None
 
+    expires_in = payload["exp"] - time.time() if "exp" in payload else TOKEN_CACHE_TTL
+    if expires_in > 0:
+        _verified_tokens.set(token, dict(payload), ttl=min(expires_in, TOKEN_CACHE_TTL))
+    return payload
+
 
 def hash_password(password: str) -> str:
     """
@@ -78,7 +97,8 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password string
     """
-    return pwd_context.hash(password)
+    password_bytes = password.encode("utf-8")[:BCRYPT_MAX_PASSWORD_BYTES]
+    return bcrypt.hashpw(password_bytes, bcrypt.gensalt(rounds=BCRYPT_ROUNDS)).decode("ascii")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -92,4 +112,11 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    # Hashes created through passlib are standard $2b$ bcrypt hashes and
+    # verify here unchanged
+    password_bytes = plain_password.encode("utf-8")[:BCRYPT_MAX_PASSWORD_BYTES]
+    try:
+        return bcrypt.checkpw(password_bytes, hashed_password.encode("ascii"))
+    except ValueError:
+        # Not a bcrypt hash
+        return False
@@ -7,7 +7,7 @@ for context retention and conversation continuity.
 
 from datetime import datetime
 from typing import Optional
-from sqlmodel import Field, SQLModel, Column, JSON
+from sqlmodel import Field, SQLModel, Column, JSON, Index
 
 
 class ConversationMessage(SQLModel, table=True):
@@ -28,11 +28,18 @@ class ConversationMessage(SQLModel, table=True):
 
     __tablename__ = "conversation_messages"
 
+    # Chat history is always the user's latest messages, newest first. This
+    # index also serves any lookup by user_id alone, so neither column has
+    # an index of its own.
+    __table_args__ = (
+        Index("ix_conversation_messages_user_created_at", "user_id", "created_at"),
+    )
+
     # Primary Key
     id: Optional[int] = Field(default=None, primary_key=True)
 
     # Foreign Key
-    user_id: int = Field(foreign_key="users.id", index=True)
+    user_id: int = Field(foreign_key="users.id")
 
     # Message Fields
     role: str = Field(max_length=20)  # 'user' or 'assistant'
@@ -49,7 +56,7 @@ class ConversationMessage(SQLModel, table=True):
     # }
 
     # Timestamp
-    created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
 
     class Config:
         """Pydantic model configuration."""
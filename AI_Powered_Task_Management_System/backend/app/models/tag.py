@@ -1,7 +1,8 @@
 """
 Tag models for task categorization and organization.
 
-Defines Tag entity and TaskTagLink association table for many-to-many relationships.
+Defines the Tag entity. Its many-to-many link to tasks uses the TaskTagLink
+association table from app.models.links.
 """
 
 from typing import Optional, List
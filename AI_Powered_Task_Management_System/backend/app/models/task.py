@@ -8,7 +8,7 @@ and business logic for task management.
 from datetime import datetime
 from enum import Enum
 from typing import Optional, List, TYPE_CHECKING
-from sqlmodel import Field, SQLModel, Relationship, Column, JSON
+from sqlmodel import Field, SQLModel, Relationship, Column, JSON, Index
 from app.models.links import TaskTagLink
 
 if TYPE_CHECKING:
@@ -59,6 +59,27 @@ class Task(SQLModel, table=True):
 
     __tablename__ = "tasks"
 
+    # Every task list is scoped to one user and ordered by a date, so these
+    # let the database seek to the user's rows in order instead of sorting
+    __table_args__ = (
+        # Per-user lists by due date, overdue and upcoming tasks
+        Index("ix_tasks_user_due_date", "user_id", "due_date"),
+        # The same lists filtered by status
+        Index("ix_tasks_user_status_due_date", "user_id", "status", "due_date"),
+        # Search results and recent-task summaries, newest update first
+        Index("ix_tasks_user_updated_at", "user_id", "updated_at"),
+        # Trigram indexes serve search's ILIKE '%term%' on PostgreSQL; other
+        # databases cannot index a leading wildcard, so they are skipped there
+        Index(
+            "ix_tasks_title_trgm", "title",
+            postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_tasks_description_trgm", "description",
+            postgresql_using="gin", postgresql_ops={"description": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
     # Primary Key
     id: Optional[int] = Field(default=None, primary_key=True)
 
@@ -94,10 +115,17 @@ class Task(SQLModel, table=True):
     # }
 
     # Relationships
+    # Subtasks and tags are part of every TaskResponse, so they are loaded
+    # with one IN query per level for all tasks of a result, not per task
     user: Optional["User"] = Relationship(back_populates="tasks")
     subtasks: List["Task"] = Relationship(
         back_populates="parent_task",
-        sa_relationship_kwargs={"foreign_keys": "Task.parent_task_id"}
+        sa_relationship_kwargs={
+            "foreign_keys": "Task.parent_task_id",
+            "lazy": "selectin",
+            # Self-referential eager loads need an explicit depth limit
+            "join_depth": 3
+        }
     )
     parent_task: Optional["Task"] = Relationship(
         back_populates="subtasks",
@@ -110,14 +138,16 @@ class Task(SQLModel, table=True):
     # Many-to-Many with Tags
     tags: List["Tag"] = Relationship(
         back_populates="tasks",
-        link_model=TaskTagLink
+        link_model=TaskTagLink,
+        sa_relationship_kwargs={"lazy": "selectin"}
     )
 
     def mark_complete(self) -> None:
         """Mark task as completed and set completion timestamp."""
+        now = datetime.utcnow()
         self.status = TaskStatus.COMPLETED
-        self.completed_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        self.completed_at = now
+        self.updated_at = now
 
     def is_overdue(self) -> bool:
         """
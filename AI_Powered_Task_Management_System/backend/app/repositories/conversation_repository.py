@@ -2,32 +2,49 @@
 Conversation Repository for database operations.
 """
 
-from typing import List, Sequence
+from typing import List, Sequence, Tuple
+from sqlalchemy import Row, bindparam, insert
 from sqlmodel import Session, select
 from app.models.conversation import ConversationMessage
 
+# A user's latest messages as (role, content) rows, newest first; only the
+# columns fed to the LLM. Built once at import time and run with bound
+# user_id and limit.
+_RECENT_MESSAGES_STATEMENT = (
+    select(ConversationMessage.role, ConversationMessage.content)
+    .where(ConversationMessage.user_id == bindparam("user_id"))
+    .order_by(ConversationMessage.created_at.desc())
+    .limit(bindparam("limit"))
+)
+
 class ConversationRepository:
     def __init__(self, session: Session):
         self.session = session
 
     def add_message(self, user_id: int, role: str, content: str) -> ConversationMessage:
-        message = ConversationMessage(
-            user_id=user_id,
-            role=role,
-            content=content
+        return self.add_messages(user_id, [(role, content)])[0]
+
+    def add_messages(self, user_id: int, messages: List[Tuple[str, str]]) -> List[ConversationMessage]:
+        """Insert (role, content) messages with one INSERT ... RETURNING and one commit."""
+        created = [
+            ConversationMessage(user_id=user_id, role=role, content=content)
+            for role, content in messages
+        ]
+        rows = [message.model_dump(exclude={"id"}) for message in created]
+        # IDs ascend in insertion order
+        message_ids = sorted(
+            self.session.scalars(insert(ConversationMessage).returning(ConversationMessage.id), rows).all()
         )
-        self.session.add(message)
         self.session.commit()
-        self.session.refresh(message)
-        return message
 
-    def get_recent_messages(self, user_id: int, limit: int = 10) -> Sequence[ConversationMessage]:
-        statement = (
-            select(ConversationMessage)
-            .where(ConversationMessage.user_id == user_id)
-            .order_by(ConversationMessage.created_at.desc())
-            .limit(limit)
-        )
+        # Every column was set client-side, so only the IDs need filling in
+        for message, message_id in zip(created, message_ids):
+            message.id = message_id
+        return created
+
+    def get_recent_messages(self, user_id: int, limit: int = 10) -> Sequence[Row]:
+        messages = self.session.exec(
+            _RECENT_MESSAGES_STATEMENT, params={"user_id": user_id, "limit": limit}
+        ).all()
         # Reverse to get chronological order for LLM context
-        messages = self.session.exec(statement).all()
-        return list(reversed(messages))
+        return messages[::-1]
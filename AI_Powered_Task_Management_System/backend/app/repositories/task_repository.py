@@ -6,13 +6,15 @@ CRUD operations, filtering, and query capabilities following
 repository pattern and SQLModel best practices.
 """
 
-from datetime import datetime
-from typing import List, Optional, Sequence
+from datetime import datetime, timedelta
+from typing import List, Optional, Sequence, Tuple
 from sqlmodel import Session, select, func, and_, or_
+from sqlalchemy import case, delete, insert, update
 from sqlalchemy.orm import selectinload
 
 from app.models.task import Task, TaskStatus, Priority
 from app.models.tag import Tag
+from app.models.links import TaskTagLink
 
 
 class TaskRepository:
@@ -51,6 +53,30 @@ class TaskRepository:
         self.session.refresh(task)
         return task
 
+    def create_many(self, tasks: List[Task]) -> List[Task]:
+        """
+        Insert several tasks in one batched INSERT and a single commit.
+
+        Args:
+            tasks: Task instances to create
+
+        Returns:
+            Created tasks, in the given order, with generated IDs and
+            relationships loaded
+
+        Example:
+            subtasks = repository.create_many([Task(title="Step 1", user_id=1)])
+        """
+        # One multi-row INSERT ... RETURNING instead of a flush per task
+        rows = [task.model_dump(exclude={"id"}) for task in tasks]
+        task_ids = self.session.scalars(insert(Task).returning(Task.id), rows).all()
+        self.session.commit()
+
+        # One SELECT loads the new rows, instead of a refresh per task;
+        # IDs ascend in insertion order
+        statement = select(Task).where(Task.id.in_(task_ids)).order_by(Task.id)
+        return list(self.session.exec(statement).all())
+
     def get_by_id(
         self,
         task_id: int,
@@ -140,25 +166,142 @@ class TaskRepository:
                 priority_filter=Priority.HIGH
             )
         """
-        statement = select(Task).where(Task.user_id == user_id)
+        filters = self._user_filters(user_id, status_filter, priority_filter, include_subtasks)
+        return self._get_user_tasks(filters, skip, limit)
+
+    def get_page_by_user(
+        self,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        status_filter: Optional[TaskStatus] = None,
+        priority_filter: Optional[Priority] = None,
+        include_subtasks: bool = True
+    ) -> Tuple[List[Task], int]:
+        """
+        Retrieve a page of get_by_user results with the total match count.
+
+        The total is computed by a window function in the same query, so a
+        page and its pagination metadata take one round trip. Only a page
+        past the last match needs a separate COUNT.
+
+        Args:
+            user_id: User ID to filter tasks
+            skip: Pagination offset
+            limit: Maximum records to return
+            status_filter: Optional status filter
+            priority_filter: Optional priority filter
+            include_subtasks: Whether to include subtasks or only top-level tasks
+
+        Returns:
+            (tasks on the page, total matching tasks)
+        """
+        filters = self._user_filters(user_id, status_filter, priority_filter, include_subtasks)
+        statement = (
+            select(Task, func.count(Task.id).over())
+            .where(*filters)
+            .order_by(*self._user_order)
+            .offset(skip)
+            .limit(limit)
+        )
+        rows = self.session.exec(statement).all()
+
+        if rows:
+            return [task for task, _ in rows], rows[0][1]
+        if skip == 0:
+            return [], 0
+        return [], self.count_by_user(user_id, status_filter, priority_filter, include_subtasks)
+
+    def count_by_user(
+        self,
+        user_id: int,
+        status_filter: Optional[TaskStatus] = None,
+        priority_filter: Optional[Priority] = None,
+        include_subtasks: bool = True
+    ) -> int:
+        """
+        Count the tasks get_by_user would return without pagination.
+
+        Args:
+            user_id: User ID to filter tasks
+            status_filter: Optional status filter
+            priority_filter: Optional priority filter
+            include_subtasks: Whether to count subtasks or only top-level tasks
+
+        Returns:
+            Number of matching tasks
+        """
+        statement = select(func.count(Task.id)).where(
+            *self._user_filters(user_id, status_filter, priority_filter, include_subtasks)
+        )
+        return self.session.exec(statement).one()
+
+    # Order of per-user task lists: due date (nulls last), then priority
+    _user_order = (Task.due_date.asc().nulls_last(), Task.priority.desc())
+
+    def _get_user_tasks(self, filters: list, skip: int, limit: int) -> Sequence[Task]:
+        """
+        Run the shared per-user task list query.
+
+        get_by_user, get_overdue_tasks and get_upcoming_tasks differ only
+        in their WHERE conditions, so they issue one statement shape and
+        the database can reuse a single cached plan for all of them.
+        """
+        statement = (
+            select(Task)
+            .where(*filters)
+            .order_by(*self._user_order)
+            .offset(skip)
+            .limit(limit)
+        )
+        return self.session.exec(statement).all()
+
+    @staticmethod
+    def _user_filters(
+        user_id: int,
+        status_filter: Optional[TaskStatus],
+        priority_filter: Optional[Priority],
+        include_subtasks: bool
+    ) -> list:
+        """Build the WHERE conditions of get_by_user, get_page_by_user and count_by_user."""
+        filters = [Task.user_id == user_id]
 
         # Filter out subtasks if requested (only get parent tasks)
         if not include_subtasks:
-            statement = statement.where(Task.parent_task_id.is_(None))
+            filters.append(Task.parent_task_id.is_(None))
 
         # Apply status filter
         if status_filter:
-            statement = statement.where(Task.status == status_filter)
+            filters.append(Task.status == status_filter)
 
         # Apply priority filter
         if priority_filter:
-            statement = statement.where(Task.priority == priority_filter)
+            filters.append(Task.priority == priority_filter)
 
-        # Order by due date (nulls last) and priority
+        return filters
+
+    def get_summaries_by_user(
+        self,
+        user_id: int,
+        limit: int = 5
+    ) -> Sequence[tuple]:
+        """
+        Retrieve lightweight (title, status, priority) rows for a user.
+
+        Selects only the three columns instead of hydrating full Task
+        objects, for callers that just render a short task list.
+
+        Args:
+            user_id: User ID to filter tasks
+            limit: Maximum rows to return
+
+        Returns:
+            (title, status, priority) tuples, most recently updated first
+        """
         statement = (
-            statement
-            .order_by(Task.due_date.asc().nulls_last(), Task.priority.desc())
-            .offset(skip)
+            select(Task.title, Task.status, Task.priority)
+            .where(Task.user_id == user_id)
+            .order_by(Task.updated_at.desc())
             .limit(limit)
         )
 
@@ -231,21 +374,12 @@ class TaskRepository:
         """
         now = datetime.utcnow()
 
-        statement = (
-            select(Task)
-            .where(
-                and_(
-                    Task.user_id == user_id,
-                    Task.due_date < now,
-                    Task.status != TaskStatus.COMPLETED
-                )
-            )
-            .order_by(Task.due_date.asc())
-            .offset(skip)
-            .limit(limit)
-        )
-
-        return self.session.exec(statement).all()
+        filters = [
+            Task.user_id == user_id,
+            Task.due_date < now,
+            Task.status != TaskStatus.COMPLETED,
+        ]
+        return self._get_user_tasks(filters, skip, limit)
 
     def get_upcoming_tasks(
         self,
@@ -269,26 +403,15 @@ class TaskRepository:
         Example:
             upcoming = repository.get_upcoming_tasks(user_id=1, days=7)
         """
-        from datetime import timedelta
-
         now = datetime.utcnow()
         future_date = now + timedelta(days=days)
 
-        statement = (
-            select(Task)
-            .where(
-                and_(
-                    Task.user_id == user_id,
-                    Task.due_date.between(now, future_date),
-                    Task.status != TaskStatus.COMPLETED
-                )
-            )
-            .order_by(Task.due_date.asc())
-            .offset(skip)
-            .limit(limit)
-        )
-
-        return self.session.exec(statement).all()
+        filters = [
+            Task.user_id == user_id,
+            Task.due_date.between(now, future_date),
+            Task.status != TaskStatus.COMPLETED,
+        ]
+        return self._get_user_tasks(filters, skip, limit)
 
     def get_subtasks(
         self,
@@ -358,6 +481,9 @@ class TaskRepository:
         Args:
             task: Task instance with updated values
 
+        The task is not reloaded after commit; load any relationships the
+        caller needs before updating.
+
         Returns:
             Updated task
 
@@ -368,7 +494,6 @@ class TaskRepository:
         task.update_timestamp()
         self.session.add(task)
         self.session.commit()
-        self.session.refresh(task)
         return task
 
     def delete(self, task: Task) -> None:
@@ -384,6 +509,39 @@ class TaskRepository:
         self.session.delete(task)
         self.session.commit()
 
+    def delete_with_subtasks(self, task: Task) -> None:
+        """
+        Delete a task and all of its subtasks, at any depth, in one transaction.
+
+        Descendants are found with one recursive query, then they and their
+        tag links are removed with one DELETE each, instead of a delete and
+        commit per subtask. Deleting the whole subtree leaves no task
+        pointing at a deleted parent.
+
+        Args:
+            task: Task instance to delete, with its subtasks
+
+        Example:
+            repository.delete_with_subtasks(task)
+        """
+        descendants = (
+            select(Task.id)
+            .where(Task.parent_task_id == task.id)
+            .cte("descendants", recursive=True)
+        )
+        descendants = descendants.union_all(
+            select(Task.id).where(Task.parent_task_id == descendants.c.id)
+        )
+        subtask_ids = self.session.exec(select(descendants.c.id)).all()
+        if subtask_ids:
+            self.session.exec(delete(TaskTagLink).where(TaskTagLink.task_id.in_(subtask_ids)))
+            self.session.exec(delete(Task).where(Task.id.in_(subtask_ids)))
+            # The loaded collection still lists the deleted rows
+            self.session.expire(task, ["subtasks"])
+
+        self.session.delete(task)
+        self.session.commit()
+
     def count_by_status(
         self,
         user_id: int,
@@ -409,6 +567,24 @@ class TaskRepository:
 
         return self.session.exec(statement).one()
 
+    def get_data_version(self, user_id: int) -> Tuple[int, Optional[datetime]]:
+        """
+        Cheap marker that changes whenever the user's tasks change.
+
+        Creating or deleting a task changes the count; updating one moves
+        the latest updated_at.
+
+        Args:
+            user_id: User ID to scope the marker
+
+        Returns:
+            (task count, latest updated_at)
+        """
+        statement = select(func.count(Task.id), func.max(Task.updated_at)).where(
+            Task.user_id == user_id
+        )
+        return tuple(self.session.exec(statement).one())
+
     def get_task_statistics(
         self,
         user_id: int
@@ -432,21 +608,23 @@ class TaskRepository:
             #   "overdue": 5
             # }
         """
-        total = self.count_by_status(user_id)
-        todo = self.count_by_status(user_id, TaskStatus.TODO)
-        in_progress = self.count_by_status(user_id, TaskStatus.IN_PROGRESS)
-        completed = self.count_by_status(user_id, TaskStatus.COMPLETED)
-
-        # Count overdue tasks
         now = datetime.utcnow()
-        overdue_statement = select(func.count(Task.id)).where(
-            and_(
-                Task.user_id == user_id,
-                Task.due_date < now,
-                Task.status != TaskStatus.COMPLETED
-            )
-        )
-        overdue = self.session.exec(overdue_statement).one()
+
+        def count_where(condition):
+            return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+        # All counts in a single scan using conditional aggregation
+        statement = select(
+            func.count(Task.id),
+            count_where(Task.status == TaskStatus.TODO),
+            count_where(Task.status == TaskStatus.IN_PROGRESS),
+            count_where(Task.status == TaskStatus.COMPLETED),
+            count_where(
+                and_(Task.due_date < now, Task.status != TaskStatus.COMPLETED)
+            ),
+        ).where(Task.user_id == user_id)
+
+        total, todo, in_progress, completed, overdue = self.session.exec(statement).one()
 
         return {
             "total": total,
@@ -474,18 +652,17 @@ class TaskRepository:
         Example:
             count = repository.bulk_update_status([1, 2, 3], TaskStatus.COMPLETED)
         """
-        statement = select(Task).where(Task.id.in_(task_ids))
-        tasks = self.session.exec(statement).all()
-
-        for task in tasks:
-            task.status = new_status
-            if new_status == TaskStatus.COMPLETED:
-                task.completed_at = datetime.utcnow()
-            task.update_timestamp()
-            self.session.add(task)
+        # One UPDATE for all rows instead of loading and saving each task
+        now = datetime.utcnow()
+        values = {"status": new_status, "updated_at": now}
+        if new_status == TaskStatus.COMPLETED:
+            values["completed_at"] = now
 
+        result = self.session.exec(
+            update(Task).where(Task.id.in_(task_ids)).values(**values)
+        )
         self.session.commit()
-        return len(tasks)
+        return result.rowcount
 
 
 def get_task_repository(session: Session) -> TaskRepository:
@@ -2,7 +2,8 @@
 Conversation Service for managing chat history.
 """
 
-from typing import List, Sequence
+from typing import List, Sequence, Tuple
+from sqlalchemy import Row
 from sqlmodel import Session
 from app.repositories.conversation_repository import ConversationRepository
 from app.models.conversation import ConversationMessage
@@ -14,5 +15,8 @@ class ConversationService:
     def save_message(self, user_id: int, role: str, content: str) -> ConversationMessage:
         return self.repository.add_message(user_id, role, content)
 
-    def get_history(self, user_id: int, limit: int = 10) -> Sequence[ConversationMessage]:
+    def save_messages(self, user_id: int, messages: List[Tuple[str, str]]) -> List[ConversationMessage]:
+        return self.repository.add_messages(user_id, messages)
+
+    def get_history(self, user_id: int, limit: int = 10) -> Sequence[Row]:
         return self.repository.get_recent_messages(user_id, limit)
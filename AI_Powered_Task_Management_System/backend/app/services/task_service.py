@@ -6,15 +6,26 @@ creation, updates, scheduling, prioritization, and task intelligence.
 """
 
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from sqlmodel import Session
 from fastapi import HTTPException, status, Depends
 
+from app.core.cache import TTLCache
 from app.core.database import get_session
 from app.models.task import Task, TaskStatus, Priority
 from app.schemas.task import TaskCreate, TaskUpdate
 from app.repositories.task_repository import TaskRepository
 
+# Seconds cached statistics may lag behind the clock; any write to the
+# user's tasks invalidates them at once, but a task can become overdue
+# without being written
+STATISTICS_CACHE_TTL = 30
+
+# Per-user (data version, statistics), shared by all requests in the process.
+# Entries are checked against the database's data version on every read, so
+# writes made by other worker processes are seen immediately too.
+_statistics_cache = TTLCache(maxsize=1024, ttl=STATISTICS_CACHE_TTL)
+
 
 class TaskService:
     """
@@ -153,6 +164,55 @@ class TaskService:
             include_subtasks=include_subtasks
         )
 
+    def list_tasks_page(
+        self,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        status_filter: Optional[TaskStatus] = None,
+        priority_filter: Optional[Priority] = None,
+        include_subtasks: bool = True
+    ) -> Tuple[List[Task], int]:
+        """
+        List a page of tasks together with the total for pagination.
+
+        Args:
+            user_id: User ID to filter tasks
+            skip: Pagination offset
+            limit: Maximum records (capped at 100)
+            status_filter: Optional status filter
+            priority_filter: Optional priority filter
+            include_subtasks: Whether to include subtasks
+
+        Returns:
+            (tasks on the page, total tasks matching the filters)
+        """
+        return self.repository.get_page_by_user(
+            user_id=user_id,
+            skip=skip,
+            limit=min(limit, 100),
+            status_filter=status_filter,
+            priority_filter=priority_filter,
+            include_subtasks=include_subtasks
+        )
+
+    def list_task_summaries(
+        self,
+        user_id: int,
+        limit: int = 5
+    ) -> List[tuple]:
+        """
+        List (title, status, priority) tuples of the user's recent tasks.
+
+        Args:
+            user_id: User ID to filter tasks
+            limit: Maximum records (capped at 100)
+
+        Returns:
+            List of (title, status, priority) tuples
+        """
+        return list(self.repository.get_summaries_by_user(user_id, min(limit, 100)))
+
     def update_task(
         self,
         task_id: int,
@@ -173,8 +233,8 @@ class TaskService:
         Raises:
             HTTPException: If task not found or validation fails
         """
-        # Get existing task
-        task = self.get_task(task_id, user_id, load_relationships=False)
+        # Get existing task, with the subtasks and tags the response includes
+        task = self.get_task(task_id, user_id, load_relationships=True)
 
         # Update only provided fields
         update_data = task_data.model_dump(exclude_unset=True)
@@ -232,10 +292,9 @@ class TaskService:
 
         # Delete subtasks if cascade enabled
         if cascade_subtasks and task.subtasks:
-            for subtask in task.subtasks:
-                self.repository.delete(subtask)
-
-        self.repository.delete(task)
+            self.repository.delete_with_subtasks(task)
+        else:
+            self.repository.delete(task)
 
     def complete_task(
         self,
@@ -254,7 +313,7 @@ class TaskService:
         Returns:
             Completed task
         """
-        task = self.get_task(task_id, user_id, load_relationships=False)
+        task = self.get_task(task_id, user_id, load_relationships=True)
 
         task.mark_complete()
 
@@ -267,7 +326,8 @@ class TaskService:
                 task.estimated_duration,
                 actual_duration
             )
-            task.task_metadata["estimation_accuracy"] = accuracy
+            # Reassigned, not mutated in place, so the JSON column is saved
+            task.task_metadata = {**task.task_metadata, "estimation_accuracy": accuracy}
 
         return self.repository.update(task)
 
@@ -346,6 +406,18 @@ class TaskService:
             limit=limit
         )
 
+    def get_data_version(self, user_id: int) -> Tuple[int, Optional[datetime]]:
+        """
+        Marker of the state of the user's tasks, for invalidating caches.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Value that differs whenever a task is created, updated or deleted
+        """
+        return self.repository.get_data_version(user_id)
+
     def get_task_statistics(
         self,
         user_id: int
@@ -353,12 +425,23 @@ class TaskService:
         """
         Get comprehensive task statistics for user.
 
+        Statistics are cached per user for up to STATISTICS_CACHE_TTL
+        seconds. A cached entry is only used while the user's data version
+        (task count and latest update) is unchanged, so a write from any
+        worker process invalidates it; checking the version is an index
+        lookup, much cheaper than the full aggregate.
+
         Args:
             user_id: User ID
 
         Returns:
             Dictionary with statistics including counts and insights
         """
+        data_version = self.get_data_version(user_id)
+        cached = _statistics_cache.get(user_id)
+        if cached is not None and cached[0] == data_version:
+            return dict(cached[1])
+
         stats = self.repository.get_task_statistics(user_id)
 
         # Add additional calculated metrics
@@ -370,6 +453,7 @@ class TaskService:
         else:
             stats["completion_rate"] = 0.0
 
+        _statistics_cache.set(user_id, (data_version, dict(stats)))
         return stats
 
     def suggest_priority(
@@ -427,9 +511,11 @@ class TaskService:
         Raises:
             HTTPException: If parent task not found
         """
-        # Validate parent task exists and user owns it
+        # Validate parent task exists and user owns it (once for all subtasks)
         parent_task = self.get_task(parent_task_id, user_id)
 
+        # One clock read stamps the whole batch
+        now = datetime.utcnow()
         subtasks = []
         for title in subtask_titles:
             subtask_data = TaskCreate(
@@ -438,10 +524,17 @@ class TaskService:
                 priority=parent_task.priority,  # Inherit parent priority
                 due_date=parent_task.due_date   # Inherit parent due date
             )
-            subtask = self.create_task(subtask_data, user_id)
+            subtask = Task(
+                **subtask_data.model_dump(exclude_unset=True),
+                user_id=user_id,
+                created_at=now,
+                updated_at=now,
+            )
+            self._apply_creation_rules(subtask)
             subtasks.append(subtask)
 
-        return subtasks
+        # Insert all subtasks in one round trip
+        return self.repository.create_many(subtasks)
 
     def bulk_update_status(
         self,
@@ -5,7 +5,7 @@ from sqlmodel import Session, SQLModel, create_engine
 from sqlmodel.pool import StaticPool
 
 from app.main import app
-from app.core.database import get_session
+from app.core.database import get_session, get_session_factory
 from app.models.user import User
 
 # Use in-memory SQLite for testing
@@ -39,7 +39,11 @@ def client_fixture(session: Session):
     def get_session_override():
         return session
 
+    def get_session_factory_override():
+        return lambda: Session(engine)
+
     app.dependency_overrides[get_session] = get_session_override
+    app.dependency_overrides[get_session_factory] = get_session_factory_override
     client = TestClient(app)
     yield client
     app.dependency_overrides.clear()
@@ -1,5 +1,9 @@
+import asyncio
+import json
 from unittest.mock import AsyncMock, patch, MagicMock
 from fastapi.testclient import TestClient
+from sqlmodel import Session, delete, select
+from app.models.conversation import ConversationMessage
 from app.models.task import Task, TaskStatus
 
 def test_nl_create_task(client: TestClient):
@@ -44,9 +48,10 @@ def test_task_breakdown(client: TestClient):
     )
     task_id = create_res.json()["data"]["id"]
 
-    # Mock Gemini response for breakdown
+    # Mock Gemini response for breakdown, streamed in chunks
+    chunks = ['["Step 1", "St', 'ep 2", ', '"Step 3"]']
     mock_response = MagicMock()
-    mock_response.text = '["Step 1", "Step 2", "Step 3"]'
+    mock_response.__aiter__.return_value = [MagicMock(text=text) for text in chunks]
 
     with patch("google.generativeai.GenerativeModel.generate_content_async", new_callable=AsyncMock) as mock_generate:
         mock_generate.return_value = mock_response
@@ -59,3 +64,136 @@ def test_task_breakdown(client: TestClient):
         assert len(data["data"]) == 3
         assert data["data"][0]["title"] == "Step 1"
         assert data["data"][0]["parent_task_id"] == task_id
+
+def _stream_job(client: TestClient, job_id: str):
+    """Read a job's Server-Sent Events stream, returning (event, data)."""
+    with client.stream("GET", f"/api/v1/jobs/{job_id}/stream") as response:
+        assert response.headers["content-type"].startswith("text/event-stream")
+        body = response.read().decode()
+    event_line, data_line = body.strip().splitlines()[-2:]
+    return event_line.removeprefix("event: "), json.loads(data_line.removeprefix("data: "))
+
+def test_nl_create_job_streams_created_task(client: TestClient):
+    mock_response = MagicMock()
+    mock_response.text = '{"title": "Call John", "priority": "high"}'
+
+    # Jobs outlive their request, so the client keeps one event loop for the
+    # whole test; the lifespan's init_db would touch the real database
+    with patch("app.main.init_db"), client, \
+            patch("google.generativeai.GenerativeModel.generate_content_async", new_callable=AsyncMock) as mock_generate:
+        mock_generate.return_value = mock_response
+
+        response = client.post("/api/v1/tasks/nl-create/jobs", json={"message": "Call John"})
+        assert response.status_code == 202
+        job_id = response.json()["data"]["job_id"]
+
+        event, job = _stream_job(client, job_id)
+        assert event == "completed"
+        assert job["result"]["title"] == "Call John"
+        assert job["result"]["priority"] == "high"
+
+        data = client.get(f"/api/v1/jobs/{job_id}").json()["data"]
+        assert data["status"] == "completed"
+        assert data["result"]["id"] == job["result"]["id"]
+
+    assert client.get("/api/v1/tasks").json()["data"]["total"] == 1
+
+def test_breakdown_job_creates_subtasks(client: TestClient):
+    task_id = client.post("/api/v1/tasks", json={"title": "Launch Website"}).json()["data"]["id"]
+
+    mock_response = MagicMock()
+    mock_response.__aiter__.return_value = [MagicMock(text='["Write copy", "Deploy"]')]
+
+    with patch("app.main.init_db"), client, \
+            patch("google.generativeai.GenerativeModel.generate_content_async", new_callable=AsyncMock) as mock_generate:
+        mock_generate.return_value = mock_response
+
+        response = client.post(f"/api/v1/tasks/{task_id}/breakdown/jobs")
+        assert response.status_code == 202
+
+        event, job = _stream_job(client, response.json()["data"]["job_id"])
+
+    assert event == "completed"
+    assert [subtask["title"] for subtask in job["result"]] == ["Write copy", "Deploy"]
+    assert all(subtask["parent_task_id"] == task_id for subtask in job["result"])
+
+def test_chat_saves_exchange_after_response(client: TestClient, session: Session):
+    mock_response = MagicMock()
+    mock_response.__aiter__.return_value = [MagicMock(text="You have no tasks yet.")]
+
+    with patch("google.generativeai.GenerativeModel.generate_content_async", new_callable=AsyncMock) as mock_generate:
+        mock_generate.return_value = mock_response
+
+        response = client.post("/api/v1/chat", json={"message": "How many tasks do I have?"})
+
+    assert response.status_code == 200
+    assert response.json()["data"] == "You have no tasks yet."
+    saved = session.exec(select(ConversationMessage).order_by(ConversationMessage.id)).all()
+    assert [(row.role, row.content) for row in saved] == [
+        ("user", "How many tasks do I have?"),
+        ("assistant", "You have no tasks yet."),
+    ]
+
+def test_chat_cache_keeps_distinct_messages_apart(client: TestClient, session: Session):
+    def streamed(text):
+        response = MagicMock()
+        response.__aiter__.return_value = [MagicMock(text=text)]
+        return response
+
+    # Non-Latin questions have no ASCII words to tell them apart
+    messages = ["Что у меня на сегодня?", "今日のタスクは何ですか?"]
+    replies = ["Сегодня задач нет.", "今日のタスクはありません。"]
+
+    with patch("google.generativeai.GenerativeModel.generate_content_async", new_callable=AsyncMock) as mock_generate:
+        mock_generate.side_effect = [streamed(text) for text in replies]
+
+        answers = []
+        for message in messages:
+            answers.append(client.post("/api/v1/chat", json={"message": message}).json()["data"])
+            # Same (empty) history for both questions, so only the message differs
+            session.exec(delete(ConversationMessage))
+            session.commit()
+
+    assert answers == replies
+    assert mock_generate.await_count == 2
+
+def test_parse_many_batches_inputs():
+    from app.agents.task_parser import get_task_parser_agent
+
+    # One response holds the tasks for every input, in order
+    mock_response = MagicMock()
+    mock_response.text = '''
+    [
+        {"title": "Water the plants", "priority": "low", "tags": ["home"]},
+        {"title": "Book dentist visit", "priority": "high", "tags": ["health"]}
+    ]
+    '''
+
+    with patch("google.generativeai.GenerativeModel.generate_content_async", new_callable=AsyncMock) as mock_generate:
+        mock_generate.return_value = mock_response
+
+        tasks = asyncio.run(get_task_parser_agent().parse_many(
+            ["water the plants on sunday", "book a dentist visit asap"]
+        ))
+
+        assert mock_generate.await_count == 1
+        assert [task.title for task in tasks] == ["Water the plants", "Book dentist visit"]
+        assert tasks[1].priority == "high"
+
+def test_canonical_input_keeps_word_order():
+    from app.agents.task_parser import canonical_input
+
+    assert canonical_input("Call Mom  in 2 days!") == canonical_input("call mom in 2 days")
+    assert canonical_input("call mom in 2 days for 10 minutes") != canonical_input(
+        "call mom in 10 days for 2 minutes"
+    )
+
+def test_canonical_input_keeps_non_latin_text():
+    from app.agents.task_parser import canonical_input
+
+    urdu = canonical_input("کل امی کو فون کریں")
+    chinese = canonical_input("明天买牛奶")
+    assert urdu and chinese
+    assert urdu != chinese
+    assert canonical_input("明天买牛奶") != canonical_input("明天买咖啡")
+    assert canonical_input("Café à 14h") == "café à 14h"
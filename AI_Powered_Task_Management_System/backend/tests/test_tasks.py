@@ -1,4 +1,5 @@
 from fastapi.testclient import TestClient
+from sqlalchemy import text
 from sqlmodel import Session
 from app.models.task import Task, TaskStatus, Priority
 
@@ -37,6 +38,18 @@ def test_read_tasks(client: TestClient):
     assert data["success"] is True
     assert len(data["data"]["tasks"]) >= 2
 
+def test_read_tasks_total_follows_filters(client: TestClient):
+    client.post("/api/v1/tasks", json={"title": "Urgent 1", "priority": "high"})
+    client.post("/api/v1/tasks", json={"title": "Urgent 2", "priority": "high"})
+    client.post("/api/v1/tasks", json={"title": "Someday", "priority": "low"})
+
+    response = client.get("/api/v1/tasks", params={"priority": "high", "limit": 1})
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert len(data["tasks"]) == 1
+    assert data["total"] == 2
+    assert data["has_more"] is True
+
 def test_update_task(client: TestClient):
     # Create task
     create_res = client.post(
@@ -73,6 +86,26 @@ def test_delete_task(client: TestClient):
     # Or if your API returns null, check that. 
     # Based on standard FastAPI patterns, 404 is expected.
 
+def test_delete_task_cascades_through_nested_subtasks(client: TestClient, session: Session):
+    # Enforce foreign keys, as PostgreSQL does
+    session.exec(text("PRAGMA foreign_keys=ON"))
+    try:
+        parent_id = client.post("/api/v1/tasks", json={"title": "Parent"}).json()["data"]["id"]
+        child_id = client.post(
+            "/api/v1/tasks", json={"title": "Child", "parent_task_id": parent_id}
+        ).json()["data"]["id"]
+        grandchild_id = client.post(
+            "/api/v1/tasks", json={"title": "Grandchild", "parent_task_id": child_id}
+        ).json()["data"]["id"]
+
+        response = client.delete(f"/api/v1/tasks/{parent_id}?cascade_subtasks=true")
+        assert response.status_code == 200
+
+        for task_id in (parent_id, child_id, grandchild_id):
+            assert client.get(f"/api/v1/tasks/{task_id}").status_code == 404
+    finally:
+        session.exec(text("PRAGMA foreign_keys=OFF"))
+
 def test_search_tasks(client: TestClient):
     client.post(
         "/api/v1/tasks",
@@ -97,3 +130,28 @@ def test_complete_task(client: TestClient):
     data = response.json()
     assert data["data"]["status"] == "completed"
     assert data["data"]["completed_at"] is not None
+
+def test_statistics_follow_task_writes(client: TestClient):
+    create_res = client.post("/api/v1/tasks", json={"title": "Count Me"})
+    task_id = create_res.json()["data"]["id"]
+
+    stats = client.get("/api/v1/tasks/statistics").json()["data"]
+    assert stats["total"] == 1
+    assert stats["completed"] == 0
+
+    client.post(f"/api/v1/tasks/{task_id}/complete")
+
+    stats = client.get("/api/v1/tasks/statistics").json()["data"]
+    assert stats["completed"] == 1
+    assert stats["completion_rate"] == 100.0
+
+def test_statistics_see_writes_from_other_processes(client: TestClient, session: Session):
+    client.post("/api/v1/tasks", json={"title": "Cached"})
+    assert client.get("/api/v1/tasks/statistics").json()["data"]["total"] == 1
+
+    # Written without going through this process's TaskService, as another
+    # worker would
+    session.add(Task(title="Elsewhere", user_id=1))
+    session.commit()
+
+    assert client.get("/api/v1/tasks/statistics").json()["data"]["total"] == 2